@@ -9,8 +9,11 @@ to extract information from a system prompt.
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+if __name__ == "__main__":
+    # Run from a checkout without installing: put the repo's src/ on the path
+    _SRC = str(Path(__file__).resolve().parent.parent / "src")
+    if _SRC not in sys.path:
+        sys.path.insert(0, _SRC)
 
 from agiterminal import SystemPromptAnalyzer
 
@@ -38,14 +41,12 @@ def main():
         # Extract capabilities
         capabilities = analyzer.extract_capabilities()
         print(f"\n🔧 Capabilities ({len(capabilities)}):")
-        for cap in capabilities:
-            print(f"  • {cap}")
+        sys.stdout.write("".join(f"  • {cap}\n" for cap in capabilities))
         
         # Identify safety measures
         safety = analyzer.identify_safety_measures()
         print(f"\n🛡️  Safety Measures ({len(safety)}):")
-        for measure, desc in safety.items():
-            print(f"  • {measure}")
+        sys.stdout.write("".join(f"  • {measure}\n" for measure in safety))
         
         # Get architecture pattern
         architecture = analyzer.identify_architecture_pattern()
@@ -55,8 +56,7 @@ def main():
         # Get unique features
         features = analyzer.extract_unique_features()
         print(f"\n✨ Unique Features ({len(features)}):")
-        for feature in features:
-            print(f"  • {feature}")
+        sys.stdout.write("".join(f"  • {feature}\n" for feature in features))
         
         # Full analysis
         print("\n" + "=" * 60)
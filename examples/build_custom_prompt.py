@@ -9,20 +9,21 @@ system prompt and customizing it for a specific use case.
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+if __name__ == "__main__":
+    # Run from a checkout without installing: put the repo's src/ on the path
+    _SRC = str(Path(__file__).resolve().parent.parent / "src")
+    if _SRC not in sys.path:
+        sys.path.insert(0, _SRC)
 
 from agiterminal import PromptBuilder, CustomizationRequest, PromptInstaller
 
 
-def demo_suggest_template():
+def demo_suggest_template(builder):
     """Show template suggestions for a use case."""
     print("=" * 70)
     print("STEP 1: Find the Right Base Template")
     print("=" * 70)
     
-    builder = PromptBuilder()
-    
     use_cases = [
         "Python coding tutor for kids",
         "Academic writing assistant",
@@ -37,18 +38,12 @@ def demo_suggest_template():
         print(f"   Relevance: {suggestions[0][2]:.0%}")
 
 
-def demo_analyze_base():
+def demo_analyze_base(builder, base_prompt):
     """Analyze a base prompt before customization."""
     print("\n" + "=" * 70)
     print("STEP 2: Analyze the Base Prompt")
     print("=" * 70)
     
-    installer = PromptInstaller()
-    builder = PromptBuilder()
-    
-    # Load Kimi's base prompt
-    base_prompt = installer.load_prompt("kimi", "base-chat")
-    
     print(f"\n📄 Loaded: kimi/base-chat ({len(base_prompt)} characters)")
     
     # Analyze it
@@ -63,20 +58,14 @@ def demo_analyze_base():
     print(f"\n💡 Customization opportunities:")
     for opp in analysis['customization_opportunities']:
         print(f"   • {opp}")
-    
-    return base_prompt
 
 
-def demo_build_custom():
+def demo_build_custom(builder, base_prompt):
     """Build a customized prompt."""
     print("\n" + "=" * 70)
     print("STEP 3: Build Customized Prompt")
     print("=" * 70)
     
-    # Load base
-    installer = PromptInstaller()
-    base_prompt = installer.load_prompt("kimi", "base-chat")
-    
     # Create customization
     print("\n📝 Customization Request:")
     print("   Use case: Python coding tutor for beginners")
@@ -101,7 +90,6 @@ def demo_build_custom():
     )
     
     # Show preview
-    builder = PromptBuilder()
     preview = builder.preview_customization(request, base_prompt)
     print(f"\n{preview}")
     
@@ -134,17 +122,13 @@ def demo_show_result(customized_prompt):
     print(f"\n💾 Saved to: {output_file}")
 
 
-def demo_compare_versions():
+def demo_compare_versions(builder, base):
     """Compare original vs customized."""
     print("\n" + "=" * 70)
     print("STEP 5: Compare Original vs Customized")
     print("=" * 70)
     
-    installer = PromptInstaller()
-    base = installer.load_prompt("kimi", "base-chat")
-    
     # Build customized
-    builder = PromptBuilder()
     request = CustomizationRequest(
         base_provider="kimi",
         base_model="base-chat",
@@ -172,12 +156,17 @@ def main():
     print("customize it for your specific use case.")
     print()
     
+    # Shared across steps so the base prompt is resolved and read once
+    installer = PromptInstaller()
+    builder = PromptBuilder()
+    base = installer.load_prompt("kimi", "base-chat")
+    
     # Run steps
-    demo_suggest_template()
-    base = demo_analyze_base()
-    customized = demo_build_custom()
+    demo_suggest_template(builder)
+    demo_analyze_base(builder, base)
+    customized = demo_build_custom(builder, base)
     demo_show_result(customized)
-    demo_compare_versions()
+    demo_compare_versions(builder, base)
     
     print("\n" + "=" * 70)
     print("Demo Complete!")
@@ -6,11 +6,15 @@ This example demonstrates how to use the MultiModelComparator
 to compare system prompts from different AI providers.
 """
 
+import io
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+if __name__ == "__main__":
+    # Run from a checkout without installing: put the repo's src/ on the path
+    _SRC = str(Path(__file__).resolve().parent.parent / "src")
+    if _SRC not in sys.path:
+        sys.path.insert(0, _SRC)
 
 from agiterminal import MultiModelComparator
 
@@ -51,15 +55,12 @@ def main():
         caps = comparator.compare_capabilities()
         
         for model, capabilities in caps.get("model_capabilities", {}).items():
-            print(f"\n{model}:")
-            for cap in capabilities:
-                print(f"  • {cap}")
+            sys.stdout.write(f"\n{model}:\n" + "".join(f"  • {cap}\n" for cap in capabilities))
         
         # Show common capabilities
         if "common_capabilities" in caps:
             print("\n🔗 Common Capabilities:")
-            for cap in caps["common_capabilities"]:
-                print(f"  • {cap}")
+            sys.stdout.write("".join(f"  • {cap}\n" for cap in caps["common_capabilities"]))
         
         # Compatibility matrix
         print("\n" + "=" * 60)
@@ -68,20 +69,19 @@ def main():
         
         matrix = comparator.generate_compatibility_matrix()
         
-        # Print header
+        # Build the whole table, then print it in one write
         model_names = list(matrix.keys())
-        print("\n" + " " * 20, end="")
-        for name in model_names:
-            print(f"{name[:10]:>12}", end="")
-        print()
+        table = io.StringIO()
+        table.write("\n" + " " * 20)
+        table.write("".join(f"{name[:10]:>12}" for name in model_names))
+        table.write("\n")
         
-        # Print rows
         for m1 in model_names:
-            print(f"{m1[:20]:20}", end="")
-            for m2 in model_names:
-                score = matrix[m1][m2]
-                print(f"{score:>12.1%}", end="")
-            print()
+            row = matrix[m1]
+            table.write(f"{m1[:20]:20}")
+            table.write("".join(f"{row[m2]:>12.1%}" for m2 in model_names))
+            table.write("\n")
+        sys.stdout.write(table.getvalue())
         
         # Safety comparison
         print("\n" + "=" * 60)
@@ -91,9 +91,7 @@ def main():
         safety = comparator.compare_safety_measures()
         
         for model, measures in safety.get("model_safety", {}).items():
-            print(f"\n{model}:")
-            for measure in measures:
-                print(f"  • {measure}")
+            sys.stdout.write(f"\n{model}:\n" + "".join(f"  • {measure}\n" for measure in measures))
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -15,8 +15,11 @@ Research Applications:
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+if __name__ == "__main__":
+    # Run from a checkout without installing: put the repo's src/ on the path
+    _SRC = str(Path(__file__).resolve().parent.parent / "src")
+    if _SRC not in sys.path:
+        sys.path.insert(0, _SRC)
 
 from agiterminal import SystemPromptAnalyzer, MultiModelComparator
 
@@ -138,9 +141,10 @@ def demo_comparison_framework():
         
         # Print simplified matrix
         model_names = list(matrix.keys())
-        for m1 in model_names:
-            scores = [f"{matrix[m1][m2]:.2f}" for m2 in model_names]
-            print(f"  {m1[:20]:20} : {' '.join(scores)}")
+        sys.stdout.write("".join(
+            f"  {m1[:20]:20} : {' '.join(f'{matrix[m1][m2]:.2f}' for m2 in model_names)}\n"
+            for m1 in model_names
+        ))
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -167,23 +171,25 @@ def demo_list_providers():
     
     # Show in columns
     cols = 4
-    for i in range(0, len(providers), cols):
-        row = providers[i:i+cols]
-        print("  " + "  ".join(f"{p:18}" for p in row))
+    sys.stdout.write("".join(
+        "  " + "  ".join(f"{p:18}" for p in providers[i:i+cols]) + "\n"
+        for i in range(0, len(providers), cols)
+    ))
     
     print()
     print("Example models from select providers:")
     print("-" * 70)
     
     # Show some example models
+    available = SystemPromptAnalyzer.list_providers_set()
     for provider in ["openai", "anthropic", "kimi", "cursor"][:4]:
-        if provider in providers:
+        if provider in available:
             models = SystemPromptAnalyzer.list_models(provider)
-            print(f"\n{provider.upper()}/")
-            for model in models[:3]:
-                print(f"  • {model}")
+            lines = [f"\n{provider.upper()}/"]
+            lines.extend(f"  • {model}" for model in models[:3])
             if len(models) > 3:
-                print(f"  ... and {len(models) - 3} more")
+                lines.append(f"  ... and {len(models) - 3} more")
+            sys.stdout.write("\n".join(lines) + "\n")
     
     return 0
 
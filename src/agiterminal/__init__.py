@@ -26,12 +26,30 @@ __version__ = "0.1.0"
 __author__ = "AgiTerminal Project"
 __license__ = "MIT"
 
-from .analyzer import SystemPromptAnalyzer
-from .comparator import MultiModelComparator
-from .benchmark import PromptBenchmark
-from .validator import EducationalValidator
-from .installer import PromptInstaller
-from .prompt_builder import PromptBuilder, CustomizationRequest, PromptTemplate
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .analyzer import SystemPromptAnalyzer
+    from .comparator import MultiModelComparator
+    from .benchmark import PromptBenchmark
+    from .validator import EducationalValidator
+    from .installer import PromptInstaller
+    from .prompt_builder import PromptBuilder, CustomizationRequest, PromptTemplate
+
+# Public names mapped to the submodule defining them. Submodules are only
+# imported on first attribute access (PEP 562), so `import agiterminal`
+# stays cheap for callers that need a single class.
+_LAZY_IMPORTS = {
+    "SystemPromptAnalyzer": "analyzer",
+    "MultiModelComparator": "comparator",
+    "PromptBenchmark": "benchmark",
+    "EducationalValidator": "validator",
+    "PromptInstaller": "installer",
+    "PromptBuilder": "prompt_builder",
+    "CustomizationRequest": "prompt_builder",
+    "PromptTemplate": "prompt_builder",
+}
 
 __all__ = [
     "SystemPromptAnalyzer",
@@ -43,3 +61,18 @@ __all__ = [
     "CustomizationRequest",
     "PromptTemplate",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes from their submodule on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported names in dir() for REPL discovery."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,28 @@
+"""
+Compatibility helpers for the range of supported Python versions.
+"""
+
+import math
+import sys
+from typing import Any, Dict
+
+# dataclass(slots=True) is only accepted on Python 3.10+; on 3.9 the
+# dataclasses fall back to a regular per-instance __dict__
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def orjson_floats(value: Any) -> Any:
+    """
+    Replace NaN and infinite floats with None, as orjson serializes them.
+    
+    The json module would otherwise write them as the invalid JSON tokens
+    NaN and Infinity; dicts, lists and tuples are converted recursively and
+    everything else is returned unchanged.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: orjson_floats(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [orjson_floats(item) for item in value]
+    return value
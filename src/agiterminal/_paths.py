@@ -5,8 +5,39 @@ Centralizes path resolution, sanitization, and file loading logic used by
 both the analyzer and installer modules.
 """
 
+import functools
+import os
+import re
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Tuple
+
+# Repository-level collections/ directory, computed once at import
+_COLLECTIONS_PATH: Path = Path(__file__).resolve().parent.parent.parent / "collections"
+_COLLECTIONS_PATH_STR: str = str(_COLLECTIONS_PATH)
+_COLLECTIONS_PATH_RESOLVED: str = os.path.realpath(_COLLECTIONS_PATH_STR)
+
+# Anything that is not alphanumeric (as str.isalnum defines it), '-', '_' or '.'
+_DISALLOWED_CHARS = re.compile(r'[^\w.-]')
+
+# The same set restricted to ASCII, as a bytes.translate deletion table
+_DISALLOWED_ASCII = bytes(
+    i for i in range(128) if not (chr(i).isalnum() or chr(i) in '-_.')
+)
+
+# Text between the first '## System Prompt' marker and the next one (or the end)
+_SYSTEM_PROMPT_SECTION = re.compile(r'## System Prompt(.*?)(?:## System Prompt|\Z)', re.DOTALL)
+
+# A leading markdown heading line, including its newline
+_LEADING_HEADING = re.compile(r'\A#[^\n]*(?:\n|\Z)')
+
+# Section terminators in priority order: a rule anywhere wins over an earlier
+# heading, so these are tried in turn rather than as one leftmost-match regex
+_SECTION_SEPARATORS: Tuple[str, ...] = ("\n---\n", "\n## ")
+
+# Byte forms of the markers above, for locating the section before decoding
+_SYSTEM_PROMPT_MARKER = b"## System Prompt"
+_SECTION_SEPARATORS_BYTES: Tuple[bytes, ...] = tuple(sep.encode() for sep in _SECTION_SEPARATORS)
 
 
 def get_collections_path() -> Path:
@@ -16,13 +47,32 @@ def get_collections_path() -> Path:
     Returns:
         Path to the collections/ directory
     """
-    return Path(__file__).parent.parent.parent / "collections"
+    return _COLLECTIONS_PATH
+
+
+def _resolve_base(base_str: str) -> str:
+    """
+    Resolve a collections directory, reusing the import-time result for the default.
+
+    Args:
+        base_str: Collections directory to resolve
+
+    Returns:
+        Fully resolved collections directory
+    """
+    if base_str == _COLLECTIONS_PATH_STR:
+        return _COLLECTIONS_PATH_RESOLVED
+    return os.path.realpath(base_str)
 
 
+@functools.lru_cache(maxsize=256)
 def sanitize_path_component(component: str) -> str:
     """
     Sanitize a path component to prevent path traversal attacks.
 
+    Memoized, since the same provider and model names are sanitized again
+    on every load and lookup.
+
     Args:
         component: The path component to sanitize
 
@@ -30,8 +80,85 @@ def sanitize_path_component(component: str) -> str:
         Sanitized component safe for path construction
     """
     sanitized = component.replace('/', '').replace('\\', '').replace('..', '')
-    sanitized = ''.join(c for c in sanitized if c.isalnum() or c in '-_.')
-    return sanitized
+    if sanitized.isascii():
+        return sanitized.encode('ascii').translate(None, _DISALLOWED_ASCII).decode('ascii')
+    return _DISALLOWED_CHARS.sub('', sanitized)
+
+
+@functools.lru_cache(maxsize=128)
+def _scan_directory(path_str: str, mtime_ns: int, kind: str) -> Tuple[str, ...]:
+    """
+    Scan a directory for providers or models, memoized per directory mtime.
+
+    The mtime is only part of the cache key: adding, removing or renaming an
+    entry bumps it, so a changed directory is rescanned on the next call.
+
+    Args:
+        path_str: Directory to scan
+        mtime_ns: Directory modification time in nanoseconds
+        kind: "providers" for provider sub-directories, "directories" for
+            every sub-directory, "models" for .md file stems
+
+    Returns:
+        Sorted tuple of entry names
+    """
+    # DirEntry.is_dir()/is_file() reuse the type reported by the directory
+    # read, so entries are not stat()ed one by one like Path.iterdir() would
+    with os.scandir(path_str) as entries:
+        if kind == "providers":
+            names = [sys.intern(entry.name) for entry in entries
+                     if entry.name != "docs" and entry.is_dir()]
+        elif kind == "directories":
+            names = [sys.intern(entry.name) for entry in entries if entry.is_dir()]
+        else:
+            # A bare ".md" is a dotfile with no suffix, as Path.suffix treats it
+            names = [sys.intern(entry.name[:-3]) for entry in entries
+                     if entry.name.endswith('.md') and len(entry.name) > 3
+                     and entry.is_file()]
+    return tuple(sorted(names))
+
+
+def _list_directory(path: Path, kind: str) -> Tuple[str, ...]:
+    """
+    Return the cached listing for a directory, or an empty tuple if it is missing.
+
+    Args:
+        path: Directory to list
+        kind: Listing kind passed through to _scan_directory
+
+    Returns:
+        Sorted tuple of entry names
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return ()
+    return _scan_directory(str(path), mtime_ns, kind)
+
+
+@functools.lru_cache(maxsize=32)
+def _provider_set(path_str: str, mtime_ns: int) -> FrozenSet[str]:
+    """
+    Build the provider set for a collections directory, memoized per mtime.
+
+    Args:
+        path_str: Collections directory to scan
+        mtime_ns: Directory modification time in nanoseconds
+
+    Returns:
+        Frozen set of provider directory names
+    """
+    return frozenset(_scan_directory(path_str, mtime_ns, "providers"))
+
+
+def clear_cache() -> None:
+    """Drop all memoized directory listings, path lookups, names and file contents."""
+    _scan_directory.cache_clear()
+    _provider_set.cache_clear()
+    _find_prompt_file.cache_clear()
+    _read_prompt_file.cache_clear()
+    _read_system_prompt.cache_clear()
+    sanitize_path_component.cache_clear()
 
 
 def list_providers(collections_path: Optional[Path] = None) -> List[str]:
@@ -47,12 +174,49 @@ def list_providers(collections_path: Optional[Path] = None) -> List[str]:
     if collections_path is None:
         collections_path = get_collections_path()
 
-    providers = []
-    if collections_path.exists():
-        for item in collections_path.iterdir():
-            if item.is_dir() and item.name != "docs":
-                providers.append(item.name)
-    return sorted(providers)
+    return list(_list_directory(collections_path, "providers"))
+
+
+def list_providers_set(collections_path: Optional[Path] = None) -> FrozenSet[str]:
+    """
+    Return the available providers as a set for repeated membership tests.
+
+    Unlike list_providers, the result is shared between callers rather than
+    copied, which is safe because it is immutable.
+
+    Args:
+        collections_path: Optional path to collections directory
+
+    Returns:
+        Frozen set of provider directory names
+    """
+    if collections_path is None:
+        collections_path = get_collections_path()
+
+    try:
+        mtime_ns = collections_path.stat().st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _provider_set(str(collections_path), mtime_ns)
+
+
+def list_directories(collections_path: Optional[Path] = None) -> List[str]:
+    """
+    List every sub-directory of the collections directory.
+
+    Unlike list_providers, the docs directory and hidden directories are
+    included, so callers can apply their own filtering.
+
+    Args:
+        collections_path: Optional path to collections directory
+
+    Returns:
+        Sorted list of directory names
+    """
+    if collections_path is None:
+        collections_path = get_collections_path()
+
+    return list(_list_directory(collections_path, "directories"))
 
 
 def list_models(provider: str, collections_path: Optional[Path] = None) -> List[str]:
@@ -69,15 +233,140 @@ def list_models(provider: str, collections_path: Optional[Path] = None) -> List[
     if collections_path is None:
         collections_path = get_collections_path()
 
-    provider_path = collections_path / provider
-    if not provider_path.exists():
-        return []
+    return list(_list_directory(collections_path / provider, "models"))
+
+
+def _name_variants(model: str) -> Tuple[str, ...]:
+    """
+    List the dash/underscore spellings of a model name, without duplicates.
+
+    Only separators that actually occur in the name produce a variant, so a
+    plain name such as "gpt4" yields a single candidate.
+
+    Args:
+        model: Sanitized model identifier
+
+    Returns:
+        Tuple of candidate file stems in probe order
+    """
+    has_dash = '-' in model
+    has_underscore = '_' in model
+    if has_dash and has_underscore:
+        return (model, model.replace('-', '_'), model.replace('_', '-'))
+    if has_dash:
+        return (model, model.replace('-', '_'))
+    if has_underscore:
+        return (model, model.replace('_', '-'))
+    return (model,)
+
+
+@functools.lru_cache(maxsize=256)
+def _find_prompt_file(provider: str, model: str, base_str: str,
+                      dir_mtime_ns: int) -> Path:
+    """
+    Find the prompt file for a sanitized provider/model pair.
+
+    Candidate names are looked up in the cached provider directory listing
+    first, so usually only a candidate that actually exists is resolved on
+    disk. Candidates missing from the listing are then probed on disk too:
+    on a case-insensitive filesystem the listing may spell the name
+    differently, and a coarse directory mtime can leave the listing stale.
+    Works on plain strings with os.path rather than building Path objects
+    per candidate. Memoized per provider-directory mtime.
+
+    Args:
+        provider: Sanitized provider name
+        model: Sanitized model identifier
+        base_str: Collections directory as a string
+        dir_mtime_ns: Provider directory mtime, or -1 if it does not exist
+
+    Returns:
+        Resolved Path to the prompt file
+
+    Raises:
+        FileNotFoundError: If no candidate exists inside the collections directory
+    """
+    provider_dir = os.path.join(base_str, provider)
+    candidates = _name_variants(model)
+
+    available: Tuple[str, ...] = ()
+    if dir_mtime_ns >= 0:
+        try:
+            available = _scan_directory(provider_dir, dir_mtime_ns, "models")
+        except OSError:
+            pass
+
+    # Trailing separator so a sibling such as "collections-evil" is not a match
+    base_prefix = os.path.join(_resolve_base(base_str), '')
+    listed = [stem for stem in candidates if stem in available]
+    unlisted = [stem for stem in candidates if stem not in available]
+    for stem in listed + unlisted:
+        try:
+            resolved = os.path.realpath(os.path.join(provider_dir, f"{stem}.md"))
+            if not resolved.startswith(base_prefix):
+                continue
+            if os.path.isfile(resolved):
+                return Path(resolved)
+        except (OSError, ValueError):
+            continue
+
+    raise FileNotFoundError(
+        f"Prompt not found for {provider}/{model}. "
+        f"Tried: {[os.path.join(provider_dir, f'{stem}.md') for stem in candidates]}"
+    )
+
+
+def _read_bytes(path_str: str) -> bytes:
+    """
+    Read a whole file in one go.
+
+    The read is unbuffered: read() on a raw file already sizes its result
+    from fstat, so a BufferedReader would only add an extra buffer.
 
-    models = []
-    for item in provider_path.iterdir():
-        if item.is_file() and item.suffix == '.md':
-            models.append(item.stem)
-    return sorted(models)
+    Args:
+        path_str: Path to the file
+
+    Returns:
+        File content as bytes
+    """
+    with open(path_str, 'rb', buffering=0) as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=128)
+def _read_prompt_file(path_str: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a prompt file, memoized on its mtime and size.
+
+    Args:
+        path_str: Resolved path to the prompt file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Raw file content as string
+    """
+    text = _read_bytes(path_str).decode('utf-8')
+    # Same newline translation as reading in text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+@functools.lru_cache(maxsize=128)
+def _read_system_prompt(path_str: str, mtime_ns: int, size: int) -> str:
+    """
+    Read just the system prompt section of a file, memoized on its mtime and size.
+
+    Args:
+        path_str: Resolved path to the prompt file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Extracted system prompt text
+    """
+    return _extract_system_prompt_bytes(_read_bytes(path_str))
 
 
 def resolve_prompt_path(provider: str, model: str,
@@ -97,8 +386,9 @@ def resolve_prompt_path(provider: str, model: str,
         FileNotFoundError: If prompt file doesn't exist
         ValueError: If provider or model is empty after sanitization
     """
-    provider = sanitize_path_component(provider)
-    model = sanitize_path_component(model)
+    # Interned so cache-key comparisons against listed names are identity checks
+    provider = sys.intern(sanitize_path_component(provider))
+    model = sys.intern(sanitize_path_component(model))
 
     if not provider or not model:
         raise ValueError("Provider and model must not be empty after sanitization")
@@ -106,27 +396,12 @@ def resolve_prompt_path(provider: str, model: str,
     if collections_path is None:
         collections_path = get_collections_path()
 
-    possible_paths = [
-        collections_path / provider / f"{model}.md",
-        collections_path / provider / f"{model.replace('-', '_')}.md",
-        collections_path / provider / f"{model.replace('_', '-')}.md",
-    ]
-
-    for path in possible_paths:
-        try:
-            resolved = path.resolve()
-            base_resolved = collections_path.resolve()
-            if not str(resolved).startswith(str(base_resolved)):
-                continue
-            if resolved.exists():
-                return resolved
-        except (OSError, ValueError):
-            continue
+    try:
+        dir_mtime_ns = os.stat(os.path.join(collections_path, provider)).st_mtime_ns
+    except OSError:
+        dir_mtime_ns = -1
 
-    raise FileNotFoundError(
-        f"Prompt not found for {provider}/{model}. "
-        f"Tried: {[str(p) for p in possible_paths]}"
-    )
+    return _find_prompt_file(provider, model, str(collections_path), dir_mtime_ns)
 
 
 def load_prompt_file(provider: str, model: str,
@@ -134,6 +409,9 @@ def load_prompt_file(provider: str, model: str,
     """
     Load raw content from a prompt file.
 
+    Repeated loads of an unchanged file are served from memory; the file is
+    re-read whenever its mtime or size changes.
+
     Args:
         provider: Provider name
         model: Model identifier
@@ -147,7 +425,34 @@ def load_prompt_file(provider: str, model: str,
         ValueError: If provider or model is invalid
     """
     prompt_path = resolve_prompt_path(provider, model, collections_path)
-    return prompt_path.read_text(encoding='utf-8')
+    stat = prompt_path.stat()
+    return _read_prompt_file(str(prompt_path), stat.st_mtime_ns, stat.st_size)
+
+
+def load_system_prompt(provider: str, model: str,
+                       collections_path: Optional[Path] = None) -> str:
+    """
+    Load only the system prompt section of a prompt file.
+
+    Equivalent to extract_system_prompt(load_prompt_file(...)), but the
+    section is located in the raw bytes so only that slice is decoded, and
+    the extracted text is cached per file mtime and size.
+
+    Args:
+        provider: Provider name
+        model: Model identifier
+        collections_path: Optional path to collections directory
+
+    Returns:
+        Extracted system prompt text
+
+    Raises:
+        FileNotFoundError: If prompt file doesn't exist
+        ValueError: If provider or model is invalid
+    """
+    prompt_path = resolve_prompt_path(provider, model, collections_path)
+    stat = prompt_path.stat()
+    return _read_system_prompt(str(prompt_path), stat.st_mtime_ns, stat.st_size)
 
 
 def extract_system_prompt(content: str) -> str:
@@ -163,18 +468,46 @@ def extract_system_prompt(content: str) -> str:
     Returns:
         Extracted system prompt text
     """
-    if "## System Prompt" in content:
-        parts = content.split("## System Prompt")
-        if len(parts) > 1:
-            prompt_part = parts[1]
-            for separator in ["\n---\n", "\n## "]:
-                if separator in prompt_part:
-                    prompt_part = prompt_part.split(separator)[0]
-                    break
-            return prompt_part.strip()
-
-    lines = content.split('\n')
-    if lines and lines[0].startswith('#'):
-        content = '\n'.join(lines[1:]).strip()
-
-    return content.strip()
+    match = _SYSTEM_PROMPT_SECTION.search(content)
+    if match:
+        prompt_part = match.group(1)
+        for separator in _SECTION_SEPARATORS:
+            head, sep, _ = prompt_part.partition(separator)
+            if sep:
+                prompt_part = head
+                break
+        return prompt_part.strip()
+
+    return _LEADING_HEADING.sub('', content, count=1).strip()
+
+
+def _extract_system_prompt_bytes(data: bytes) -> str:
+    """
+    Byte-level counterpart of extract_system_prompt for raw UTF-8 file data.
+
+    The markers are ASCII, which never occurs inside a multi-byte UTF-8
+    sequence, so they can be found in the undecoded bytes. Files without the
+    section marker, or with carriage returns that text-mode reading would
+    translate, go through the str implementation instead.
+
+    Args:
+        data: Raw file content
+
+    Returns:
+        Extracted system prompt text
+    """
+    start = data.find(_SYSTEM_PROMPT_MARKER)
+    if start < 0 or b'\r' in data:
+        content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        return extract_system_prompt(content)
+
+    start += len(_SYSTEM_PROMPT_MARKER)
+    end = data.find(_SYSTEM_PROMPT_MARKER, start)
+    if end < 0:
+        end = len(data)
+    for separator in _SECTION_SEPARATORS_BYTES:
+        cut = data.find(separator, start, end)
+        if cut >= 0:
+            end = cut
+            break
+    return data[start:end].decode('utf-8').strip()
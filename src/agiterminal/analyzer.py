@@ -7,15 +7,18 @@ identifying safety measures, and comparing different configurations.
 This module is designed for educational and research purposes.
 """
 
+import functools
+import itertools
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import ClassVar, Dict, FrozenSet, Iterable, List, Optional, Any, Set, Tuple, Type
 from dataclasses import dataclass
 
 from . import _paths
+from ._compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AnalysisResult:
     """Result of system prompt analysis."""
     provider: str
@@ -27,6 +30,184 @@ class AnalysisResult:
     unique_features: List[str]
 
 
+def _unique_phrases(*groups: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Merge phrase groups into one tuple, dropping repeats but keeping order.
+
+    Args:
+        *groups: Iterables of lowercase phrases
+
+    Returns:
+        Tuple of distinct phrases
+    """
+    return tuple(dict.fromkeys(phrase for group in groups for phrase in group))
+
+
+def _find_phrases(text_lower: str, phrases: Iterable[str]) -> FrozenSet[str]:
+    """
+    Return the phrases that occur in already-lowercased text.
+
+    Args:
+        text_lower: Lowercased text to search
+        phrases: Lowercase phrases to look for
+
+    Returns:
+        Frozen set of the phrases found
+    """
+    return frozenset(filter(text_lower.__contains__, phrases))
+
+
+def _find_phrases_chunked(text: str, phrases: Iterable[str],
+                          chunk_size: int) -> FrozenSet[str]:
+    """
+    Return the phrases that occur in text, lowercasing it a chunk at a time.
+
+    Equivalent to _find_phrases(text.lower(), phrases) but never holds a
+    lowercased copy of more than one chunk, and stops looking for a phrase
+    once it has been found. Consecutive chunks overlap by the longest
+    phrase length so matches spanning a boundary are not missed.
+
+    Args:
+        text: Text to search, in its original case
+        phrases: Lowercase phrases to look for
+        chunk_size: Number of characters lowercased per step
+
+    Returns:
+        Frozen set of the phrases found
+    """
+    remaining = set(phrases)
+    found: Set[str] = set()
+    overlap = max(map(len, remaining), default=1) - 1
+    for start in range(0, len(text), chunk_size):
+        chunk = text[start:start + chunk_size + overlap].lower()
+        hits = set(filter(chunk.__contains__, remaining))
+        found |= hits
+        remaining -= hits
+        if not remaining:
+            break
+    return frozenset(found)
+
+
+def _line_index(text: str) -> Dict[int, str]:
+    """
+    Index the distinct non-blank lines of a text by their hash.
+
+    Set operations on the int keys compare machine words instead of line
+    text, and insertion order keeps lines in document order.
+
+    Args:
+        text: Text to index
+
+    Returns:
+        Mapping of line hash to stripped line, in first-occurrence order
+    """
+    return {hash(line): line for line in map(str.strip, text.split('\n')) if line}
+
+
+def _count_up_to(text: str, sub: str, limit: int) -> int:
+    """
+    Count occurrences of a substring, stopping once the limit is reached.
+
+    Args:
+        text: Text to search
+        sub: Non-empty substring to count
+        limit: Maximum count needed by the caller
+
+    Returns:
+        Number of occurrences, capped at limit
+    """
+    count = 0
+    pos = text.find(sub)
+    while pos >= 0 and count < limit:
+        count += 1
+        pos = text.find(sub, pos + len(sub))
+    return count
+
+
+# Prompts longer than this many characters are scanned in chunks of
+# _SCAN_CHUNK_SIZE instead of being lowercased in one full-size copy
+_CHUNKED_SCAN_THRESHOLD = 1 << 20
+_SCAN_CHUNK_SIZE = 1 << 16
+
+
+# Hashable snapshot of a CAPABILITY_KEYWORDS table: (capability, keywords) pairs
+_CapabilityTable = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+def _freeze_capabilities(keywords: Dict[str, List[str]]) -> _CapabilityTable:
+    """Snapshot a CAPABILITY_KEYWORDS table as it is now, in a hashable form."""
+    return tuple(
+        (capability, tuple(phrases)) for capability, phrases in keywords.items()
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _phrase_union(analyzer_cls: Type["SystemPromptAnalyzer"],
+                  capability_table: _CapabilityTable) -> Tuple[str, ...]:
+    """
+    Collect every extractor's phrases for one analyzer class, without repeats.
+
+    Built from the class's own tables, so subclasses that override
+    CAPABILITY_KEYWORDS (or the rule tables) are searched for their phrases.
+    Plain substring tests are used on purpose: one alternation regex over the
+    same phrases is several times slower and, since its matches cannot
+    overlap, misses a phrase that starts inside another one's match.
+
+    Args:
+        analyzer_cls: Analyzer class whose rule tables apply
+        capability_table: Snapshot of the class's CAPABILITY_KEYWORDS
+
+    Returns:
+        Tuple of distinct lowercase phrases
+    """
+    return _unique_phrases(
+        *(keywords for _, keywords in capability_table),
+        *(phrases for phrases, _ in analyzer_cls._SAFETY_RULES.values()),
+        analyzer_cls._TOOL_PHRASES, analyzer_cls._TOOL_CALL_PHRASES,
+        analyzer_cls._PERSONA_PHRASES, analyzer_cls._PERSONA_ROLE_PHRASES,
+        *(group for _, groups in analyzer_cls._FEATURE_RULES for group in groups),
+    )
+
+
+# Immutable form of one prompt's findings: capabilities, safety measure
+# items, architecture pattern and unique features
+_Findings = Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...], str, Tuple[str, ...]]
+
+
+@functools.lru_cache(maxsize=128)
+def _analyze_prompt(analyzer_cls: Type["SystemPromptAnalyzer"],
+                    capability_table: _CapabilityTable, prompt: str) -> _Findings:
+    """
+    Run every extractor over a prompt, memoized per analyzer class, keywords and prompt text.
+
+    The capability keywords are part of the key, so changing a class's
+    CAPABILITY_KEYWORDS at runtime is not answered from stale entries.
+    Results are kept as tuples so cached entries cannot be changed through
+    the lists and dicts handed out in AnalysisResult.
+
+    Args:
+        analyzer_cls: Analyzer class whose phrase tables apply
+        capability_table: Snapshot of the class's CAPABILITY_KEYWORDS
+        prompt: The system prompt text
+
+    Returns:
+        Capabilities, safety measure items, architecture pattern and features
+    """
+    # One pass over the prompt for every extractor's phrases; very large
+    # prompts are lowercased in chunks rather than copied whole
+    phrases = _phrase_union(analyzer_cls, capability_table)  # type: ignore[arg-type]
+    if len(prompt) > _CHUNKED_SCAN_THRESHOLD:
+        hits = _find_phrases_chunked(prompt, phrases, _SCAN_CHUNK_SIZE)
+    else:
+        hits = _find_phrases(prompt.lower(), phrases)
+    return (
+        tuple(analyzer_cls._capabilities_from(hits, capability_table)),
+        tuple(analyzer_cls._safety_measures_from(hits).items()),
+        analyzer_cls._architecture_pattern_from(hits, prompt),
+        tuple(analyzer_cls._unique_features_from(hits, prompt)),
+    )
+
+
 class SystemPromptAnalyzer:
     """
     Analyzes system prompt structure and patterns.
@@ -48,16 +229,17 @@ class SystemPromptAnalyzer:
         model: The model identifier
     """
     
-    # Common refusal indicators for detection
-    REFUSAL_INDICATORS = [
-        "i cannot", "i'm sorry", "i apologize",
-        "i cannot fulfill", "as an ai", "i'm unable to",
-        "this request", "against my", "i'm not comfortable",
-        "i can't", "i won't", "not appropriate"
+    # Common refusal indicators for detection, most common openers first so
+    # is_refusal stops early on typical refusals
+    REFUSAL_INDICATORS: ClassVar[List[str]] = [
+        "i'm sorry", "i can't", "i cannot", "i apologize",
+        "i'm unable to", "i won't", "as an ai", "not appropriate",
+        "i'm not comfortable", "against my", "this request",
+        "i cannot fulfill"
     ]
     
     # Capability keywords to search for
-    CAPABILITY_KEYWORDS = {
+    CAPABILITY_KEYWORDS: ClassVar[Dict[str, List[str]]] = {
         "image": ["image", "vision", "visual", "picture", "photo"],
         "code": ["code", "programming", "python", "javascript", "coding"],
         "search": ["search", "browse", "web", "internet", "look up"],
@@ -69,6 +251,39 @@ class SystemPromptAnalyzer:
         "tools": ["tool", "function", "api", "plugin"],
     }
     
+    # Safety measure -> (trigger phrases, description)
+    _SAFETY_RULES: ClassVar[Dict[str, Tuple[Tuple[str, ...], str]]] = {
+        "prohibitions": (("do not", "don't", "never"),
+                         "Explicit prohibitions or restrictions found"),
+        "refusal_behavior": (("refuse", "cannot", "unable to"),
+                             "Instructions for refusing certain requests"),
+        "harm_prevention": (("harm", "harmful", "safety", "safe"),
+                            "Harm prevention guidelines present"),
+        "privacy_protection": (("personal information", "privacy", "confidential"),
+                               "Privacy protection guidelines present"),
+        "bias_mitigation": (("bias", "fair", "unbiased"),
+                            "Bias mitigation guidelines present"),
+        "disclaimers": (("disclaimer", "not medical"),
+                        "Appropriate use disclaimers present"),
+    }
+    
+    # Phrases behind the architecture pattern checks
+    _TOOL_PHRASES: ClassVar[Tuple[str, ...]] = ("tool",)
+    _TOOL_CALL_PHRASES: ClassVar[Tuple[str, ...]] = ("function", "api", "call")
+    _PERSONA_PHRASES: ClassVar[Tuple[str, ...]] = ("you are", "your role", "act as")
+    _PERSONA_ROLE_PHRASES: ClassVar[Tuple[str, ...]] = ("expert", "assistant")
+    
+    # Unique feature -> phrase groups; each group needs at least one phrase present
+    _FEATURE_RULES: ClassVar[
+        Tuple[Tuple[str, Tuple[Tuple[str, ...], ...]], ...]
+    ] = (
+        ("Adaptive behavior instructions", (("adapt", "adjust"),)),
+        ("Personality/tone specifications", (("personality", "tone"),)),
+        ("Step-by-step reasoning instructions", (("step", "first"),)),
+        ("Active questioning instructions", (("ask",), ("question",))),
+        ("Knowledge cutoff acknowledgment", (("cutoff", "knowledge"),)),
+    )
+    
     def __init__(self, api_key: Optional[str] = None, 
                  base_url: Optional[str] = None, 
                  model: Optional[str] = None):
@@ -83,10 +298,41 @@ class SystemPromptAnalyzer:
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
-        self.system_prompt: Optional[str] = None
+        self.system_prompt = None
         self.provider: Optional[str] = None
         self.model_id: Optional[str] = None
     
+    @property
+    def system_prompt(self) -> Optional[str]:
+        """The loaded system prompt content."""
+        return self._system_prompt
+    
+    @system_prompt.setter
+    def system_prompt(self, value: Optional[str]) -> None:
+        self._system_prompt = value
+        # Hashed line index for compare_with_baseline, built on first use
+        self._prompt_lines: Optional[Dict[int, str]] = None
+    
+    def _scan(self) -> _Findings:
+        """
+        Return every extractor's findings for the loaded prompt.
+        
+        All extractors share one memoized pass over the prompt, so calling
+        several of them (or full_analysis) scans the prompt only once.
+        
+        Raises:
+            ValueError: If no system prompt is loaded
+        """
+        if not self._system_prompt:
+            raise ValueError("No system prompt loaded. Call load_prompt() first.")
+        return _analyze_prompt(type(self), self._capability_table(), self._system_prompt)  # type: ignore[arg-type]
+    
+    def _lines(self) -> Dict[int, str]:
+        """Return the prompt's line index, computing it once per loaded prompt."""
+        if self._prompt_lines is None:
+            self._prompt_lines = _line_index(self._system_prompt or "")
+        return self._prompt_lines
+    
     @staticmethod
     def list_providers(collections_path: Optional[Path] = None) -> List[str]:
         """
@@ -100,6 +346,19 @@ class SystemPromptAnalyzer:
         """
         return _paths.list_providers(collections_path)
     
+    @staticmethod
+    def list_providers_set(collections_path: Optional[Path] = None) -> FrozenSet[str]:
+        """
+        Get the available providers as a set for fast membership tests.
+
+        Args:
+            collections_path: Optional path to collections directory
+
+        Returns:
+            Frozen set of provider directory names
+        """
+        return _paths.list_providers_set(collections_path)
+    
     @staticmethod
     def list_models(provider: str, collections_path: Optional[Path] = None) -> List[str]:
         """
@@ -137,8 +396,7 @@ class SystemPromptAnalyzer:
         self.provider = _paths.sanitize_path_component(provider)
         self.model_id = _paths.sanitize_path_component(model)
 
-        content = _paths.load_prompt_file(provider, model)
-        self.system_prompt = _paths.extract_system_prompt(content)
+        self.system_prompt = _paths.load_system_prompt(provider, model)
         return self.system_prompt
     
     def extract_capabilities(self) -> List[str]:
@@ -153,17 +411,20 @@ class SystemPromptAnalyzer:
             >>> caps = analyzer.extract_capabilities()
             >>> print(caps)  # ['image', 'code', 'analysis', ...]
         """
-        if not self.system_prompt:
-            raise ValueError("No system prompt loaded. Call load_prompt() first.")
-        
-        capabilities = []
-        prompt_lower = self.system_prompt.lower()
-        
-        for capability, keywords in self.CAPABILITY_KEYWORDS.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                capabilities.append(capability)
-        
-        return capabilities
+        return list(self._scan()[0])
+    
+    def _capability_table(self) -> _CapabilityTable:
+        """Snapshot this analyzer's CAPABILITY_KEYWORDS, instance overrides included."""
+        return _freeze_capabilities(self.CAPABILITY_KEYWORDS)
+    
+    @staticmethod
+    def _capabilities_from(hits: FrozenSet[str],
+                           capability_table: _CapabilityTable) -> List[str]:
+        """Build the capability list from phrase hits."""
+        return [
+            capability for capability, keywords in capability_table
+            if not hits.isdisjoint(keywords)
+        ]
     
     def identify_safety_measures(self) -> Dict[str, str]:
         """
@@ -177,32 +438,16 @@ class SystemPromptAnalyzer:
             >>> safety = analyzer.identify_safety_measures()
             >>> print(safety.keys())  # ['refusal_behavior', 'privacy_protection', ...]
         """
-        if not self.system_prompt:
-            raise ValueError("No system prompt loaded. Call load_prompt() first.")
-        
-        safety_measures = {}
-        prompt_lower = self.system_prompt.lower()
-        
-        # Check for common safety patterns
-        if any(phrase in prompt_lower for phrase in ["do not", "don't", "never"]):
-            safety_measures["prohibitions"] = "Explicit prohibitions or restrictions found"
-        
-        if any(phrase in prompt_lower for phrase in ["refuse", "cannot", "unable to"]):
-            safety_measures["refusal_behavior"] = "Instructions for refusing certain requests"
-        
-        if any(phrase in prompt_lower for phrase in ["harm", "harmful", "safety", "safe"]):
-            safety_measures["harm_prevention"] = "Harm prevention guidelines present"
-        
-        if any(phrase in prompt_lower for phrase in ["personal information", "privacy", "confidential"]):
-            safety_measures["privacy_protection"] = "Privacy protection guidelines present"
-        
-        if any(phrase in prompt_lower for phrase in ["bias", "fair", "unbiased"]):
-            safety_measures["bias_mitigation"] = "Bias mitigation guidelines present"
-        
-        if "disclaimer" in prompt_lower or "not medical" in prompt_lower:
-            safety_measures["disclaimers"] = "Appropriate use disclaimers present"
-        
-        return safety_measures
+        return dict(self._scan()[1])
+    
+    @classmethod
+    def _safety_measures_from(cls, hits: FrozenSet[str]) -> Dict[str, str]:
+        """Build the safety measure mapping from phrase hits."""
+        return {
+            measure: description
+            for measure, (phrases, description) in cls._SAFETY_RULES.items()
+            if not hits.isdisjoint(phrases)
+        }
     
     def identify_architecture_pattern(self) -> str:
         """
@@ -211,26 +456,26 @@ class SystemPromptAnalyzer:
         Returns:
             Description of the architecture pattern
         """
-        if not self.system_prompt:
-            raise ValueError("No system prompt loaded. Call load_prompt() first.")
-        
-        prompt_lower = self.system_prompt.lower()
-        
+        return self._scan()[2]
+    
+    @classmethod
+    def _architecture_pattern_from(cls, hits: FrozenSet[str], prompt: str) -> str:
+        """Pick the architecture pattern from phrase hits and the raw prompt."""
         # Check for tool-based patterns
-        if "tool" in prompt_lower and any(x in prompt_lower for x in ["function", "api", "call"]):
+        if not hits.isdisjoint(cls._TOOL_PHRASES) and not hits.isdisjoint(cls._TOOL_CALL_PHRASES):
             return "Tool-based with function calling"
         
         # Check for persona-based patterns
-        if any(x in prompt_lower for x in ["you are", "your role", "act as"]):
-            if "expert" in prompt_lower or "assistant" in prompt_lower:
+        if not hits.isdisjoint(cls._PERSONA_PHRASES):
+            if not hits.isdisjoint(cls._PERSONA_ROLE_PHRASES):
                 return "Persona-based with role definition"
         
-        # Check for instruction-based patterns
-        if prompt_lower.count("-") > 10 or "1." in self.system_prompt[:500]:
+        # Check for instruction-based patterns ('-' is unaffected by lowercasing)
+        if _count_up_to(prompt, "-", 11) > 10 or "1." in prompt[:500]:
             return "Instruction-based with enumerated guidelines"
         
         # Check for hybrid patterns
-        if len(self.system_prompt) > 2000:
+        if len(prompt) > 2000:
             return "Hybrid multi-section with detailed specifications"
         
         return "Standard conversational assistant"
@@ -242,31 +487,19 @@ class SystemPromptAnalyzer:
         Returns:
             List of unique features identified
         """
-        if not self.system_prompt:
-            raise ValueError("No system prompt loaded. Call load_prompt() first.")
-        
-        features = []
-        prompt_lower = self.system_prompt.lower()
-        
-        # Check for various distinctive features
-        if "adapt" in prompt_lower or "adjust" in prompt_lower:
-            features.append("Adaptive behavior instructions")
-        
-        if "personality" in prompt_lower or "tone" in prompt_lower:
-            features.append("Personality/tone specifications")
-        
-        if "step" in prompt_lower or "first" in prompt_lower:
-            features.append("Step-by-step reasoning instructions")
-        
-        if "ask" in prompt_lower and "question" in prompt_lower:
-            features.append("Active questioning instructions")
-        
-        if "cutoff" in prompt_lower or "knowledge" in prompt_lower:
-            features.append("Knowledge cutoff acknowledgment")
-        
-        if len(self.system_prompt) > 3000:
+        return list(self._scan()[3])
+    
+    @classmethod
+    def _unique_features_from(cls, hits: FrozenSet[str], prompt: str) -> List[str]:
+        """Build the unique feature list from phrase hits and the prompt length."""
+        features = [
+            feature for feature, groups in cls._FEATURE_RULES
+            if all(not hits.isdisjoint(group) for group in groups)
+        ]
+        
+        if len(prompt) > 3000:
             features.append("Extensive detailed instructions")
-        elif len(self.system_prompt) < 500:
+        elif len(prompt) < 500:
             features.append("Concise minimal instructions")
         
         return features
@@ -288,25 +521,26 @@ class SystemPromptAnalyzer:
         if not self.system_prompt:
             raise ValueError("No system prompt loaded. Call load_prompt() first.")
         
-        # Simple line-based comparison
-        current_lines = set(line.strip() for line in self.system_prompt.split('\n') if line.strip())
-        baseline_lines = set(line.strip() for line in baseline_prompt.split('\n') if line.strip())
+        # Simple line-based comparison on hashed lines; the current prompt's
+        # index is reused across calls, so only the baseline is split here
+        current = self._lines()
+        baseline = _line_index(baseline_prompt)
         
-        intersection = current_lines & baseline_lines
-        union = current_lines | baseline_lines
+        common = len(current.keys() & baseline.keys())
+        union = len(current) + len(baseline) - common
         
-        similarity = len(intersection) / len(union) if union else 1.0
+        similarity = common / union if union else 1.0
         
-        added = current_lines - baseline_lines
-        removed = baseline_lines - current_lines
+        added = (line for key, line in current.items() if key not in baseline)
+        removed = (line for key, line in baseline.items() if key not in current)
         
         return {
             "similarity_score": similarity,
-            "lines_added": len(added),
-            "lines_removed": len(removed),
-            "unique_to_current": list(added)[:10],
-            "unique_to_baseline": list(removed)[:10],
-            "common_lines": len(intersection)
+            "lines_added": len(current) - common,
+            "lines_removed": len(baseline) - common,
+            "unique_to_current": list(itertools.islice(added, 10)),
+            "unique_to_baseline": list(itertools.islice(removed, 10)),
+            "common_lines": common
         }
     
     def full_analysis(self) -> AnalysisResult:
@@ -321,19 +555,56 @@ class SystemPromptAnalyzer:
             >>> result = analyzer.full_analysis()
             >>> print(f"Architecture: {result.architecture_pattern}")
         """
-        if not self.system_prompt:
-            raise ValueError("No system prompt loaded. Call load_prompt() first.")
+        capabilities, safety_measures, architecture, features = self._scan()
         
         return AnalysisResult(
             provider=self.provider or "unknown",
             model=self.model_id or "unknown",
-            capabilities=self.extract_capabilities(),
-            safety_measures=self.identify_safety_measures(),
-            architecture_pattern=self.identify_architecture_pattern(),
-            prompt_length=len(self.system_prompt),
-            unique_features=self.extract_unique_features()
+            capabilities=list(capabilities),
+            safety_measures=dict(safety_measures),
+            architecture_pattern=architecture,
+            prompt_length=len(self._system_prompt or ""),
+            unique_features=list(features)
         )
     
+    @classmethod
+    def analyze_many(cls, prompts: Iterable[str]) -> List[AnalysisResult]:
+        """
+        Analyze several system prompts without loading each into an analyzer.
+        
+        Each prompt goes through the same memoized scan as full_analysis, so
+        repeated prompts in the batch (or prompts analyzed before) are only
+        scanned once.
+        
+        Args:
+            prompts: System prompt texts to analyze
+            
+        Returns:
+            One AnalysisResult per prompt, in input order, with provider and
+            model set to "unknown"
+            
+        Raises:
+            ValueError: If any prompt is empty
+        """
+        capability_table = _freeze_capabilities(cls.CAPABILITY_KEYWORDS)
+        results = []
+        for prompt in prompts:
+            if not prompt:
+                raise ValueError("Cannot analyze an empty system prompt.")
+            capabilities, safety_measures, architecture, features = _analyze_prompt(
+                cls, capability_table, prompt  # type: ignore[arg-type]
+            )
+            results.append(AnalysisResult(
+                provider="unknown",
+                model="unknown",
+                capabilities=list(capabilities),
+                safety_measures=dict(safety_measures),
+                architecture_pattern=architecture,
+                prompt_length=len(prompt),
+                unique_features=list(features)
+            ))
+        return results
+    
     def is_refusal(self, text: str) -> bool:
         """
         Check if a response text appears to be a refusal.
@@ -344,5 +615,4 @@ class SystemPromptAnalyzer:
         Returns:
             True if the text appears to be a refusal
         """
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in self.REFUSAL_INDICATORS)
+        return any(map(text.lower().__contains__, self.REFUSAL_INDICATORS))
@@ -8,20 +8,124 @@ Usage:
     agiterminal validate --directory collections/
 """
 
+import os
 import sys
 import click
-import json
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from agiterminal import __version__
 from agiterminal import _paths
-from agiterminal.analyzer import SystemPromptAnalyzer
-from agiterminal.comparator import MultiModelComparator
-from agiterminal.benchmark import PromptBenchmark, AbstractionLevel
-from agiterminal.validator import EducationalValidator
-from agiterminal.installer import PromptInstaller
-from agiterminal.prompt_builder import PromptBuilder, CustomizationRequest
+
+if TYPE_CHECKING:
+    from agiterminal.analyzer import AnalysisResult
+
+# Subsystems are imported inside the command that uses them, so `--help`
+# and light commands do not pay for loading every module at startup.
+
+# Buffer size for report files written by _emit_report
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Rules framing report sections
+_SEP = "=" * 60
+_SUBSEP = "-" * 60
+_SEP_NL = "\n" + _SEP
+
+
+def _banner(title: str) -> Tuple[str, str, str]:
+    """Return the lines of a report header: a blank line, then the title between rules."""
+    return (_SEP_NL, title, _SEP)
+
+
+def _write_all(path: str, data: str) -> None:
+    """Write a finished string to a file as UTF-8 with raw os.write calls.
+
+    The text is encoded once and handed to the OS directly, skipping the
+    text and buffered layers a one-shot write gains nothing from. Lines
+    end in "\\n" on every platform.
+
+    Args:
+        path: File to create or truncate
+        data: Complete file content
+    """
+    payload = memoryview(data.encode("utf-8"))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        # os.write may accept less than the whole buffer for very large data
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
+
+
+def _join_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield lines separated by newlines, without a trailing one."""
+    separator = ""
+    for line in lines:
+        yield separator
+        yield line
+        separator = "\n"
+
+
+def _emit_text(chunks: Iterable[str], output: Optional[str] = None) -> None:
+    """Stream text chunks to a file or to stdout as they are produced.
+
+    The text is never joined into one string. Files get the chunks
+    as-is, encoded as UTF-8 like every other file the CLI writes, and
+    stdout gets a trailing newline, as ``click.echo`` would add.
+
+    Args:
+        chunks: Pieces of text to write in order
+        output: Path of the file to write, or None to write to stdout
+    """
+    if output:
+        with open(output, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as out:
+            out.writelines(chunks)
+    else:
+        # "-" gives the same stdout wrapper click.echo writes through
+        with click.open_file("-", "w") as stdout:
+            stdout.writelines(chunks)
+            stdout.write("\n")
+            stdout.flush()
+
+
+def _emit_report(lines: Iterable[str], output: Optional[str] = None) -> None:
+    """Stream report lines, typically from an ``_iter_*`` builder.
+
+    Args:
+        lines: Report lines without line endings
+        output: Path of the file to write, or None to write to stdout
+    """
+    _emit_text(_join_lines(lines), output)
+
+
+def _emit_json(data: Dict[str, Any], output: Optional[str] = None) -> None:
+    """Write data as JSON indented by two spaces to a file or to stdout.
+
+    Uses orjson when it is installed. Otherwise the json module's
+    encoder is streamed chunk by chunk instead of building the document,
+    set up like orjson: non-ASCII text is written as-is and NaN or
+    infinite floats are written as null rather than as invalid JSON.
+
+    Args:
+        data: JSON-serializable data with string keys
+        output: Path of the file to write, or None to write to stdout
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        from agiterminal._compat import orjson_floats
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        _emit_text(encoder.iterencode(orjson_floats(data)), output)
+        return
+    
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    if output:
+        Path(output).write_bytes(payload)
+    else:
+        click.echo(payload)
 
 
 @click.group()
@@ -37,6 +141,32 @@ def cli():
     pass
 
 
+def _iter_analysis_report(provider: str, model: str,
+                          result: "AnalysisResult") -> Iterator[str]:
+    """Yield the lines of the text report for ``analyze``."""
+    yield from _banner(f"📋 System Prompt Analysis: {provider}/{model}")
+    yield ""
+    yield f"Architecture Pattern: {result.architecture_pattern}"
+    yield f"Prompt Length: {result.prompt_length} characters"
+    yield ""
+    yield f"🔧 Capabilities ({len(result.capabilities)}):"
+    for cap in result.capabilities:
+        yield f"  • {cap}"
+    
+    yield ""
+    yield f"🛡️  Safety Measures ({len(result.safety_measures)}):"
+    for measure, desc in result.safety_measures.items():
+        yield f"  • {measure}: {desc}"
+    
+    if result.unique_features:
+        yield ""
+        yield "✨ Unique Features:"
+        for feature in result.unique_features:
+            yield f"  • {feature}"
+    
+    yield _SEP
+
+
 @cli.command()
 @click.option('--provider', required=True, 
               help='Provider name (e.g., openai, anthropic, kimi)')
@@ -57,6 +187,8 @@ def analyze(provider: str, model: str, api_key: Optional[str],
         agiterminal analyze --provider kimi --model base-chat
         agiterminal analyze --provider openai --model gpt-4.5 --format json
     """
+    from agiterminal.analyzer import SystemPromptAnalyzer
+    
     click.echo(f"🔍 Analyzing {provider}/{model}...")
     
     try:
@@ -74,44 +206,12 @@ def analyze(provider: str, model: str, api_key: Optional[str],
                 "prompt_length": result.prompt_length,
                 "unique_features": result.unique_features
             }
-            output_str = json.dumps(output_data, indent=2)
+            _emit_json(output_data, output)
         else:
-            lines = [
-                f"\n{'='*60}",
-                f"📋 System Prompt Analysis: {provider}/{model}",
-                f"{'='*60}",
-                f"",
-                f"Architecture Pattern: {result.architecture_pattern}",
-                f"Prompt Length: {result.prompt_length} characters",
-                f"",
-                f"🔧 Capabilities ({len(result.capabilities)}):"
-            ]
-            for cap in result.capabilities:
-                lines.append(f"  • {cap}")
-            
-            lines.extend([
-                f"",
-                f"🛡️  Safety Measures ({len(result.safety_measures)}):"
-            ])
-            for measure, desc in result.safety_measures.items():
-                lines.append(f"  • {measure}: {desc}")
-            
-            if result.unique_features:
-                lines.extend([
-                    f"",
-                    f"✨ Unique Features:"
-                ])
-                for feature in result.unique_features:
-                    lines.append(f"  • {feature}")
-            
-            lines.append(f"{'='*60}")
-            output_str = '\n'.join(lines)
+            _emit_report(_iter_analysis_report(provider, model, result), output)
         
         if output:
-            Path(output).write_text(output_str)
             click.echo(f"\n✅ Results saved to {output}")
-        else:
-            click.echo(output_str)
             
     except FileNotFoundError as e:
         click.echo(f"❌ Error: {e}", err=True)
@@ -121,6 +221,44 @@ def analyze(provider: str, model: str, api_key: Optional[str],
         sys.exit(1)
 
 
+def _iter_comparison_report(prompt1: str, prompt2: str, caps: Dict[str, Any],
+                            matrix: Dict[str, Dict[str, float]],
+                            safety: Dict[str, Any]) -> Iterator[str]:
+    """Yield the lines of the report for ``compare``."""
+    yield from _banner(f"📊 Comparison: {prompt1} vs {prompt2}")
+    yield ""
+    yield "🔧 Capabilities Comparison:"
+    
+    for model, capabilities in caps.get("model_capabilities", {}).items():
+        yield f"\n{model}:"
+        for cap in capabilities:
+            yield f"  • {cap}"
+    
+    if "common_capabilities" in caps:
+        yield ""
+        yield "🔗 Common Capabilities:"
+        for cap in caps["common_capabilities"]:
+            yield f"  • {cap}"
+    
+    yield ""
+    yield "📈 Compatibility Matrix:"
+    
+    for m1, scores in matrix.items():
+        yield f"\n{m1}:"
+        for m2, score in scores.items():
+            yield f"  vs {m2}: {score:.1%}"
+    
+    yield ""
+    yield "🛡️  Safety Measures Comparison:"
+    
+    for model, measures in safety.get("model_safety", {}).items():
+        yield f"\n{model}:"
+        for measure in measures:
+            yield f"  • {measure}"
+    
+    yield _SEP
+
+
 @cli.command()
 @click.option('--prompt1', required=True, 
               help='First prompt (provider/model)')
@@ -134,6 +272,8 @@ def compare(prompt1: str, prompt2: str, output: Optional[str]):
     Example:
         agiterminal compare --prompt1 openai/gpt-4.5 --prompt2 kimi/base-chat
     """
+    from agiterminal.comparator import MultiModelComparator
+    
     click.echo(f"🔄 Comparing {prompt1} vs {prompt2}...")
     
     try:
@@ -148,64 +288,46 @@ def compare(prompt1: str, prompt2: str, output: Optional[str]):
         matrix = comparator.generate_compatibility_matrix()
         safety = comparator.compare_safety_measures()
         
-        lines = [
-            f"\n{'='*60}",
-            f"📊 Comparison: {prompt1} vs {prompt2}",
-            f"{'='*60}",
-            f"",
-            f"🔧 Capabilities Comparison:"
-        ]
-        
-        for model, capabilities in caps.get("model_capabilities", {}).items():
-            lines.append(f"\n{model}:")
-            for cap in capabilities:
-                lines.append(f"  • {cap}")
-        
-        if "common_capabilities" in caps:
-            lines.extend([
-                f"",
-                f"🔗 Common Capabilities:"
-            ])
-            for cap in caps["common_capabilities"]:
-                lines.append(f"  • {cap}")
-        
-        lines.extend([
-            f"",
-            f"📈 Compatibility Matrix:"
-        ])
-        
-        for m1, scores in matrix.items():
-            lines.append(f"\n{m1}:")
-            for m2, score in scores.items():
-                lines.append(f"  vs {m2}: {score:.1%}")
-        
-        lines.extend([
-            f"",
-            f"🛡️  Safety Measures Comparison:"
-        ])
-        
-        for model, measures in safety.get("model_safety", {}).items():
-            lines.append(f"\n{model}:")
-            for measure, desc in measures.items():
-                lines.append(f"  • {measure}")
-        
-        lines.append(f"{'='*60}")
-        
-        output_str = '\n'.join(lines)
-        
+        _emit_report(
+            _iter_comparison_report(prompt1, prompt2, caps, matrix, safety),
+            output
+        )
         if output:
-            Path(output).write_text(output_str)
             click.echo(f"\n✅ Results saved to {output}")
-        else:
-            click.echo(output_str)
             
     except Exception as e:
         click.echo(f"❌ Error comparing prompts: {e}", err=True)
         sys.exit(1)
 
 
+def _iter_benchmark_report(report: Dict[str, Any]) -> Iterator[str]:
+    """Yield the lines of the report for ``benchmark``."""
+    summary = report['summary']
+    yield from _banner("📊 Benchmark Report (Theoretical)")
+    yield ""
+    yield "Summary:"
+    yield f"  Total Tests: {summary['total_tests']}"
+    yield f"  Levels Tested: {summary['levels_tested']}"
+    yield f"  Overall Refusal Rate: {summary['overall_refusal_rate']:.1%}"
+    yield ""
+    yield "Level Statistics:"
+    
+    for level_key, stats in report['level_statistics'].items():
+        yield ""
+        yield f"  {stats['name']} ({level_key}):"
+        yield f"    Refusal Rate: {stats['refusal_rate']:.1%}"
+        yield f"    Theoretical: {stats['theoretical_projection']:.1%}"
+        yield f"    Tests: {stats['total_tests']}"
+    
+    yield ""
+    yield "Educational Note:"
+    yield f"  {report['educational_note']}"
+    yield _SEP
+
+
 @cli.command()
-@click.option('--prompt', required=True, type=click.Path(exists=True),
+@click.option('--prompt', required=True,
+              type=click.Path(exists=True, dir_okay=False), metavar='PATH',
               help='Path to prompt file to benchmark')
 @click.option('--levels', default=5, type=int,
               help='Number of abstraction levels to test (1-5)')
@@ -222,12 +344,12 @@ def benchmark(prompt: str, levels: int, test_cases: Optional[str],
     Example:
         agiterminal benchmark --prompt system_prompt.md --levels 5
     """
+    from agiterminal.benchmark import PromptBenchmark, AbstractionLevel
+    
     click.echo(f"📈 Running theoretical benchmark with {levels} levels...")
     click.echo("⚠️  Note: Results are theoretical projections for educational purposes")
     
     try:
-        prompt_content = Path(prompt).read_text()
-        
         prompt_benchmark = PromptBenchmark(levels=levels)
         
         # Use provided or default test cases
@@ -245,74 +367,87 @@ def benchmark(prompt: str, levels: int, test_cases: Optional[str],
         # Since we don't have actual API access in this demo,
         # create mock results for demonstration
         import random
-        random.seed(42)  # For reproducibility
+        # A private generator seeded as before gives the same reproducible
+        # draws without reseeding the global random module; its bound
+        # methods are looked up once rather than on every iteration
+        rng = random.Random(42)
+        roll, uniform = rng.random, rng.uniform
         
         from agiterminal.benchmark import BenchmarkResult
         
+        # The level and its projection depend only on the level index
+        projections = prompt_benchmark.theoretical_projections
+        level_plan = [
+            (AbstractionLevel(level_value), projections.get(level_value, 0.5))
+            for level_value in range(levels)
+        ]
+        
+        # Collected locally and added to the benchmark in one extend
+        simulated: List[BenchmarkResult] = []
+        add_result = simulated.append
+        
         for case in cases:
-            for level_value in range(levels):
-                level = AbstractionLevel(level_value)
+            for level, projection in level_plan:
                 modified = prompt_benchmark.apply_abstraction(case, level)
 
                 # Simulate results based on theoretical projections
-                projection = prompt_benchmark.theoretical_projections.get(level_value, 0.5)
-                refused = random.random() > projection
+                refused = roll() > projection
                 
                 result = BenchmarkResult(
                     level=level,
                     test_case=case,
                     response="Simulated response" if not refused else None,
                     refused=refused,
-                    response_time=random.uniform(0.5, 2.0),
+                    response_time=uniform(0.5, 2.0),
                     metadata={"modified_prompt": modified[:100] + "..."}
                 )
                 
-                prompt_benchmark.results.append(result)
+                add_result(result)
 
+        prompt_benchmark.results.extend(simulated)
         report = prompt_benchmark.generate_report()
         
-        lines = [
-            f"\n{'='*60}",
-            f"📊 Benchmark Report (Theoretical)",
-            f"{'='*60}",
-            f"",
-            f"Summary:",
-            f"  Total Tests: {report['summary']['total_tests']}",
-            f"  Levels Tested: {report['summary']['levels_tested']}",
-            f"  Overall Refusal Rate: {report['summary']['overall_refusal_rate']:.1%}",
-            f"",
-            f"Level Statistics:"
-        ]
-        
-        for level_key, stats in report['level_statistics'].items():
-            lines.extend([
-                f"",
-                f"  {stats['name']} ({level_key}):",
-                f"    Refusal Rate: {stats['refusal_rate']:.1%}",
-                f"    Theoretical: {stats['theoretical_projection']:.1%}",
-                f"    Tests: {stats['total_tests']}"
-            ])
-        
-        lines.extend([
-            f"",
-            f"Educational Note:",
-            f"  {report['educational_note']}",
-            f"{'='*60}"
-        ])
-        
-        output_str = '\n'.join(lines)
-        
+        _emit_report(_iter_benchmark_report(report), output)
         if output:
-            Path(output).write_text(output_str)
             click.echo(f"\n✅ Results saved to {output}")
-        else:
-            click.echo(output_str)
             
     except Exception as e:
         click.echo(f"❌ Error running benchmark: {e}", err=True)
         sys.exit(1)
 
 
+def _iter_suggestions(reqs: Dict[str, Any],
+                      suggestions: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the lines of the report for ``suggest``."""
+    yield from _banner("💡 Model Suggestions")
+    yield ""
+    
+    if reqs.get("capabilities"):
+        yield f"Required Capabilities: {', '.join(reqs['capabilities'])}\n"
+    
+    for i, sugg in enumerate(suggestions[:5], 1):
+        yield f"{i}. {sugg['model']}"
+        yield f"   Match Score: {sugg['match_score']:.2f}"
+        yield f"   Architecture: {sugg['architecture']['pattern']}"
+        
+        caps = sugg['capabilities_match']
+        if caps.get('matched'):
+            yield f"   Matched: {', '.join(caps['matched'])}"
+        if caps.get('extra'):
+            yield f"   Extra: {', '.join(caps['extra'][:3])}"
+        yield ""
+    
+    yield _SEP
+
+
+def _load_yaml(path: str) -> Any:
+    """Parse a YAML file with the safe loader, using libyaml's C version when available."""
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader)
+
+
 @cli.command()
 @click.option('--requirements', type=click.Path(exists=True),
               help='Path to requirements YAML file')
@@ -323,6 +458,8 @@ def suggest(requirements: Optional[str], capabilities: Optional[str]):
     Example:
         agiterminal suggest --capabilities code,analysis,reasoning
     """
+    from agiterminal.comparator import MultiModelComparator
+    
     click.echo("🔎 Finding compatible models...")
     
     try:
@@ -332,10 +469,7 @@ def suggest(requirements: Optional[str], capabilities: Optional[str]):
             reqs["capabilities"] = [c.strip() for c in capabilities.split(',')]
         
         if requirements:
-            import yaml
-            with open(requirements) as f:
-                file_reqs = yaml.safe_load(f)
-                reqs.update(file_reqs)
+            reqs.update(_load_yaml(requirements))
         
         if not reqs:
             click.echo("⚠️  No requirements specified. Using default comparison.")
@@ -363,32 +497,7 @@ def suggest(requirements: Optional[str], capabilities: Optional[str]):
         
         suggestions = comparator.suggest_alternative_models(reqs)
         
-        lines = [
-            f"\n{'='*60}",
-            f"💡 Model Suggestions",
-            f"{'='*60}",
-            f""
-        ]
-        
-        if reqs.get("capabilities"):
-            lines.append(f"Required Capabilities: {', '.join(reqs['capabilities'])}\n")
-        
-        for i, sugg in enumerate(suggestions[:5], 1):
-            lines.extend([
-                f"{i}. {sugg['model']}",
-                f"   Match Score: {sugg['match_score']:.2f}",
-                f"   Architecture: {sugg['architecture']['pattern']}"
-            ])
-            
-            caps = sugg['capabilities_match']
-            if caps.get('matched'):
-                lines.append(f"   Matched: {', '.join(caps['matched'])}")
-            if caps.get('extra'):
-                lines.append(f"   Extra: {', '.join(caps['extra'][:3])}")
-            lines.append("")
-        
-        lines.append(f"{'='*60}")
-        click.echo('\n'.join(lines))
+        _emit_report(_iter_suggestions(reqs, suggestions))
         
     except Exception as e:
         click.echo(f"❌ Error suggesting models: {e}", err=True)
@@ -402,14 +511,19 @@ def suggest(requirements: Optional[str], capabilities: Optional[str]):
               help='Single file to validate')
 @click.option('--output', '-o', type=click.Path(),
               help='Output report file')
+@click.option('--cache', type=click.Path(dir_okay=False),
+              help='JSON file of results reused for unchanged files (with --directory)')
 def validate(directory: Optional[str], file: Optional[str], 
-             output: Optional[str]):
+             output: Optional[str], cache: Optional[str]):
     """Validate content for educational guidelines.
     
     Example:
         agiterminal validate --directory collections/
         agiterminal validate --file prompt.md --output report.md
+        agiterminal validate --directory collections/ --cache .validate-cache.json
     """
+    from agiterminal.validator import EducationalValidator
+    
     validator = EducationalValidator()
     
     results = {}
@@ -420,7 +534,7 @@ def validate(directory: Optional[str], file: Optional[str],
     
     elif directory:
         click.echo(f"🔍 Validating directory: {directory}...")
-        results = validator.batch_validate_directory(directory)
+        results = validator.batch_validate_directory(directory, cache_path=cache)
     
     else:
         click.echo("❌ Please specify --directory or --file", err=True)
@@ -430,7 +544,7 @@ def validate(directory: Optional[str], file: Optional[str],
     report = validator.generate_validation_report(results)
     
     if output:
-        Path(output).write_text(report)
+        _write_all(output, report)
         click.echo(f"✅ Validation report saved to {output}")
     else:
         click.echo("\n" + report)
@@ -442,6 +556,28 @@ def validate(directory: Optional[str], file: Optional[str],
         sys.exit(1)
 
 
+def _md_file_name(model: str) -> str:
+    """Sort key ordering model names by file name, so "gpt-5-mini.md" precedes "gpt-5.md"."""
+    return model + ".md"
+
+
+def _iter_model_listing(base_path: Path) -> Iterator[str]:
+    """Yield the lines of the ``list-models`` listing after its header."""
+    # Listings come from the mtime-keyed caches in _paths, so repeated
+    # calls in one process do not rescan unchanged directories
+    for provider in _paths.list_directories(base_path):
+        if not provider.startswith('.'):
+            yield f"\n{provider.upper()}/"
+
+            models = sorted(
+                (name for name in _paths.list_models(provider, base_path)
+                 if name != "README"),
+                key=_md_file_name
+            )
+            for model_name in models:
+                yield f"  • {model_name}"
+
+
 @cli.command()
 def list_models():
     """List all available models in the collection.
@@ -452,20 +588,15 @@ def list_models():
     click.echo("📚 Available Models in Collection\n")
 
     base_path = _paths.get_collections_path()
-    if not base_path.exists():
+    # A plain stat on the path; a file in its place counts as missing too
+    if not os.path.isdir(base_path):
         click.echo("❌ collections/ directory not found", err=True)
         sys.exit(1)
 
-    for provider_dir in sorted(base_path.iterdir()):
-        if provider_dir.is_dir() and not provider_dir.name.startswith('.'):
-            click.echo(f"\n{provider_dir.name.upper()}/")
-
-            md_files = list(provider_dir.glob("*.md"))
-            md_files = [f for f in md_files if f.name != "README.md"]
-
-            for model_file in sorted(md_files):
-                model_name = model_file.stem
-                click.echo(f"  • {model_name}")
+    # One write for the whole listing rather than an echo per line
+    lines = list(_iter_model_listing(base_path))
+    if lines:
+        _emit_report(lines)
 
 
 @cli.command()
@@ -495,6 +626,8 @@ def install(provider: str, model: str, fmt: str, output: Optional[str],
         agiterminal install --provider cursor --model agent-prompt-2.0 --output prompt.md
         agiterminal install --provider kimi --model base-chat --example
     """
+    from agiterminal.installer import PromptInstaller
+    
     click.echo(f"📦 Installing {provider}/{model}...")
     
     try:
@@ -508,6 +641,18 @@ def install(provider: str, model: str, fmt: str, output: Optional[str],
             click.echo("💡 Run 'agiterminal list-models' to see available prompts")
             sys.exit(1)
         
+        # Show integration example if requested; it does not use the
+        # formatted prompt, so it returns before formatting
+        if example:
+            click.echo("\n".join([
+                _SEP_NL,
+                f"📖 Integration Example: {provider}/{model}",
+                _SEP + "\n",
+                installer.get_integration_example(provider),
+                _SEP_NL
+            ]))
+            return
+        
         # Format the prompt
         formatted = installer.format_output(fmt)
         if isinstance(formatted, dict):
@@ -516,18 +661,9 @@ def install(provider: str, model: str, fmt: str, output: Optional[str],
         else:
             formatted_str = formatted
         
-        # Show integration example if requested
-        if example:
-            click.echo(f"\n{'='*60}")
-            click.echo(f"📖 Integration Example: {provider}/{model}")
-            click.echo(f"{'='*60}\n")
-            click.echo(installer.get_integration_example(provider))
-            click.echo(f"\n{'='*60}")
-            return
-        
         # Save to file if output specified
         if output:
-            Path(output).write_text(formatted_str)
+            _write_all(output, formatted_str)
             click.echo(f"✅ Saved to: {output}")
         
         # Copy to clipboard if requested
@@ -543,19 +679,25 @@ def install(provider: str, model: str, fmt: str, output: Optional[str],
         
         # Print preview to stdout if no output file and not copied
         if not output and not copy:
-            click.echo(f"\n{'='*60}")
-            click.echo(f"📋 System Prompt: {provider}/{model}")
-            click.echo(f"{'='*60}\n")
-            
             # Show first 200 characters as preview
-            preview = formatted_str[:200] + "..." if len(formatted_str) > 200 else formatted_str
-            click.echo(preview)
+            total = len(formatted_str)
+            truncated = total > 200
+            preview = formatted_str[:200] + "..." if truncated else formatted_str
+            lines = [
+                _SEP_NL,
+                f"📋 System Prompt: {provider}/{model}",
+                _SEP + "\n",
+                preview
+            ]
             
-            if len(formatted_str) > 200:
-                click.echo(f"\n... ({len(formatted_str)} characters total)")
+            if truncated:
+                lines.append(f"\n... ({total} characters total)")
             
-            click.echo(f"\n💡 Use --output to save to file, --copy to copy to clipboard")
-            click.echo(f"{'='*60}")
+            lines.extend([
+                "\n💡 Use --output to save to file, --copy to copy to clipboard",
+                _SEP
+            ])
+            click.echo("\n".join(lines))
             
     except SystemExit:
         raise
@@ -603,9 +745,10 @@ def build(provider: str, model: str, use_case: str, role: Optional[str],
             --use-case "DevOps automation assistant" \\
             --interactive
     """
-    click.echo(f"🔨 Building customized prompt...")
-    click.echo(f"Base: {provider}/{model}")
-    click.echo(f"Use case: {use_case}")
+    from agiterminal.installer import PromptInstaller
+    from agiterminal.prompt_builder import PromptBuilder, CustomizationRequest
+    
+    click.echo(f"🔨 Building customized prompt...\nBase: {provider}/{model}\nUse case: {use_case}")
     
     try:
         # Load the base prompt
@@ -624,20 +767,24 @@ def build(provider: str, model: str, use_case: str, role: Optional[str],
         analysis = builder.analyze_base_prompt(provider, model, base_prompt)
         
         if interactive:
-            click.echo("\n" + "=" * 60)
-            click.echo("INTERACTIVE CUSTOMIZATION MODE")
-            click.echo("=" * 60)
-            
-            # Show analysis
-            click.echo(f"\n📊 Base Template Analysis:")
-            click.echo(f"   Structure: {analysis['structure']}")
+            lines = [
+                _SEP_NL,
+                "INTERACTIVE CUSTOMIZATION MODE",
+                _SEP,
+                # Show analysis
+                "\n📊 Base Template Analysis:",
+                f"   Structure: {analysis['structure']}"
+            ]
             if analysis['detected_role']:
-                click.echo(f"   Current role: {analysis['detected_role'][:60]}...")
-            click.echo(f"   Capabilities found: {analysis['detected_capabilities']}")
+                lines.append(f"   Current role: {analysis['detected_role'][:60]}...")
+            lines.extend([
+                f"   Capabilities found: {analysis['detected_capabilities']}",
+                "\n💡 Customization Options (press Enter to skip):"
+            ])
+            # Written in one go before the first prompt reads input
+            click.echo("\n".join(lines))
             
             # Interactive prompts
-            click.echo("\n💡 Customization Options (press Enter to skip):")
-            
             role = click.prompt("   Role description", default=role or "")
             tone = click.prompt("   Tone/style", default=tone or "")
             
@@ -697,25 +844,25 @@ def build(provider: str, model: str, use_case: str, role: Optional[str],
         customized = builder.build(request, base_prompt)
         
         # Save to file
-        output_path = Path(output)
-        output_path.write_text(customized, encoding='utf-8')
-        
-        click.echo(f"\n✅ Customized prompt saved to: {output}")
-        click.echo(f"   Original length: {len(base_prompt)} characters")
-        click.echo(f"   Customized length: {len(customized)} characters")
-        
-        # Show preview of result
-        click.echo(f"\n📋 Preview (first 300 chars):")
-        click.echo("-" * 60)
-        preview = customized[:300] + "..." if len(customized) > 300 else customized
-        click.echo(preview)
-        click.echo("-" * 60)
-        
-        # Usage hint
-        click.echo(f"\n💡 Next steps:")
-        click.echo(f"   1. Review: cat {output}")
-        click.echo(f"   2. Edit: Adjust the prompt as needed")
-        click.echo(f"   3. Use: Import into your AI application")
+        _write_all(output, customized)
+        
+        customized_length = len(customized)
+        snippet = customized[:300] + "..." if customized_length > 300 else customized
+        click.echo("\n".join([
+            f"\n✅ Customized prompt saved to: {output}",
+            f"   Original length: {len(base_prompt)} characters",
+            f"   Customized length: {customized_length} characters",
+            # Show preview of result
+            "\n📋 Preview (first 300 chars):",
+            _SUBSEP,
+            snippet,
+            _SUBSEP,
+            # Usage hint
+            "\n💡 Next steps:",
+            f"   1. Review: cat {output}",
+            "   2. Edit: Adjust the prompt as needed",
+            "   3. Use: Import into your AI application"
+        ]))
         
     except Exception as e:
         click.echo(f"❌ Error building prompt: {e}", err=True)
@@ -731,42 +878,48 @@ def suggest_template(use_case: str):
         agiterminal suggest-template "Python coding tutor"
         agiterminal suggest-template "Creative writing assistant"
     """
-    click.echo(f"🔍 Suggesting templates for: {use_case}")
-    click.echo("=" * 60)
+    from agiterminal.installer import PromptInstaller
+    from agiterminal.prompt_builder import PromptBuilder
+    
+    click.echo(f"🔍 Suggesting templates for: {use_case}\n{_SEP}")
     
     try:
         builder = PromptBuilder()
+        installer = PromptInstaller()
         suggestions = builder.suggest_template_for_use_case(use_case)
+        lines = []
         
         if not suggestions:
-            click.echo("No specific suggestions found. Try these general templates:")
+            lines.append("No specific suggestions found. Try these general templates:")
             suggestions = [
                 ("kimi", "base-chat", 0.70),
                 ("openai", "gpt-4o", 0.65),
             ]
         
-        click.echo(f"\nTop suggestions:\n")
+        lines.append("\nTop suggestions:\n")
         
         for i, (provider, model, score) in enumerate(suggestions, 1):
-            click.echo(f"{i}. {provider}/{model}")
-            click.echo(f"   Relevance: {score:.0%}")
+            lines.append(f"{i}. {provider}/{model}")
+            lines.append(f"   Relevance: {score:.0%}")
             
             # Try to load and show snippet
             try:
-                installer = PromptInstaller()
                 prompt = installer.load_prompt(provider, model)
                 snippet = prompt[:100].replace('\n', ' ')
-                click.echo(f"   Preview: {snippet}...")
+                lines.append(f"   Preview: {snippet}...")
             except Exception:
                 pass
             
-            click.echo()
+            lines.append("")
         
-        click.echo("💡 Use with 'agiterminal build':")
-        click.echo(f"   agiterminal build --provider {suggestions[0][0]} \\")
-        click.echo(f"       --model {suggestions[0][1]} \\")
-        click.echo(f"       --use-case \"{use_case}\" \\")
-        click.echo(f"       --output my-prompt.md")
+        lines.extend([
+            "💡 Use with 'agiterminal build':",
+            f"   agiterminal build --provider {suggestions[0][0]} \\",
+            f"       --model {suggestions[0][1]} \\",
+            f"       --use-case \"{use_case}\" \\",
+            "       --output my-prompt.md"
+        ])
+        click.echo("\n".join(lines))
         
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
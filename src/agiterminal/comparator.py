@@ -7,6 +7,7 @@ generating compatibility matrices, and suggesting alternative models.
 This module is designed for educational and research purposes.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 import json
@@ -52,10 +53,24 @@ class MultiModelComparator:
         self.analyzers: Dict[str, SystemPromptAnalyzer] = {}
         self.results: Dict[str, AnalysisResult] = {}
     
+    # Upper bound on concurrent prompt loads in load_multiple_prompts
+    MAX_LOAD_WORKERS = 8
+    
+    @staticmethod
+    def _analyze_prompt(provider: str, model: str) -> Tuple[SystemPromptAnalyzer, AnalysisResult]:
+        """Load and fully analyze a single prompt."""
+        # Create analyzer (without API for static analysis)
+        analyzer = SystemPromptAnalyzer("", "", model)
+        analyzer.load_prompt(provider, model)
+        return analyzer, analyzer.full_analysis()
+    
     def load_multiple_prompts(self, provider_models: List[str]) -> None:
         """
         Load multiple system prompts for comparison.
         
+        Prompt files are loaded and analyzed on a small thread pool so their
+        reads overlap; results and warnings keep the order of the input list.
+        
         Args:
             provider_models: List of "provider/model" strings
                            e.g., ["openai/gpt-4.5", "anthropic/claude-sonnet-3.7"]
@@ -68,20 +83,23 @@ class MultiModelComparator:
             ...     "anthropic/claude-sonnet-3.7"
             ... ])
         """
-        for pm in provider_models:
-            if "/" not in pm:
+        valid = [pm for pm in provider_models if "/" in pm]
+        jobs: Dict[int, Future] = {}
+        
+        if valid:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_LOAD_WORKERS, len(valid))) as executor:
+                for i, pm in enumerate(provider_models):
+                    if "/" in pm:
+                        provider, model = pm.split("/", 1)
+                        jobs[i] = executor.submit(self._analyze_prompt, provider, model)
+        
+        for i, pm in enumerate(provider_models):
+            if i not in jobs:
                 print(f"Warning: Invalid format '{pm}', expected 'provider/model'")
                 continue
             
-            provider, model = pm.split("/", 1)
-            
             try:
-                # Create analyzer (without API for static analysis)
-                analyzer = SystemPromptAnalyzer("", "", model)
-                analyzer.load_prompt(provider, model)
-                
-                # Perform full analysis
-                result = analyzer.full_analysis()
+                analyzer, result = jobs[i].result()
                 
                 self.analyzers[pm] = analyzer
                 self.results[pm] = result
@@ -279,14 +297,17 @@ class MultiModelComparator:
         for model, result in self.results.items():
             model_caps = set(result.capabilities)
             
-            # Calculate capability match score
+            # Calculate capability match score; each set operation is done
+            # once and reused for both the score and the reported lists
             if required_caps:
                 matched_caps = required_caps & model_caps
+                missing_caps = required_caps - model_caps
+                extra_caps = model_caps - required_caps
                 cap_score = len(matched_caps) / len(required_caps)
-                extra_caps = len(model_caps - required_caps)
             else:
+                matched_caps = missing_caps = set()
+                extra_caps = model_caps
                 cap_score = 1.0
-                extra_caps = len(model_caps)
             
             # Check safety requirements
             safety_count = len(result.safety_measures)
@@ -306,7 +327,6 @@ class MultiModelComparator:
                 score += 0.1
             
             # Penalize for missing required capabilities
-            missing_caps = required_caps - model_caps
             if missing_caps:
                 score -= len(missing_caps) * 0.3
             
@@ -315,9 +335,9 @@ class MultiModelComparator:
                 "match_score": round(max(0, score), 2),
                 "capabilities_match": {
                     "required": list(required_caps),
-                    "matched": list(matched_caps) if required_caps else [],
-                    "missing": list(missing_caps) if required_caps else [],
-                    "extra": list(model_caps - required_caps) if required_caps else list(model_caps)
+                    "matched": list(matched_caps),
+                    "missing": list(missing_caps),
+                    "extra": list(extra_caps)
                 },
                 "safety_measures": {
                     "count": safety_count,
@@ -282,10 +282,9 @@ print(result["choices"][0]["message"]["content"])
         self.provider = _paths.sanitize_path_component(provider)
         self.model_id = _paths.sanitize_path_component(model)
 
-        content = _paths.load_prompt_file(provider, model)
-        self.raw_content = content
-
-        self.system_prompt = _paths.extract_system_prompt(content)
+        # The file is resolved and read once; both fields come from that content
+        self.raw_content = _paths.load_prompt_file(provider, model)
+        self.system_prompt = _paths.extract_system_prompt(self.raw_content)
         return self.system_prompt
     
     def extract_clean_prompt(self, content: str) -> str:
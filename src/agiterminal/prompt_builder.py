@@ -9,11 +9,36 @@ This is the core innovation of AgiTerminal - making system prompts
 installable AND customizable.
 """
 
+import functools
 import re
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Pattern, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
+from ._compat import DATACLASS_SLOTS
+
+@functools.lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...], flags: int) -> Tuple[Pattern[str], ...]:
+    """Compile a pattern list with the given flags, once per list and flags."""
+    return tuple(re.compile(p, flags) for p in patterns)
+
+
+# Numbered and bulleted instruction blocks picked out by parse_prompt
+_INSTRUCTION_RES = (
+    re.compile(r"(?:\d+\.\s+[^\n]+\n?)+"),  # Numbered lists
+    re.compile(r"(?:[-•]\s+[^\n]+\n?){3,}"),  # Bullet lists
+)
+
+# Existing tone/style statement replaced by _apply_tone_customization
+_TONE_STATEMENT_RE = re.compile(
+    r"(?:tone|style|communication)[^.]*(?:is|should be|must be)[^.]*\.?",
+    re.IGNORECASE
+)
+
+# Existing output format section dropped by _apply_output_format
+_OUTPUT_SECTION_RE = re.compile(r"\n\n### Output Format.*?(?=\n\n###|$)", re.DOTALL)
+
 
 class CustomizationType(Enum):
     """Types of customizations that can be applied."""
@@ -27,7 +52,7 @@ class CustomizationType(Enum):
     OUTPUT_FORMAT = "output"         # Change output format instructions
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PromptTemplate:
     """A parsed system prompt template."""
     original: str
@@ -50,7 +75,7 @@ class PromptTemplate:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CustomizationRequest:
     """A request to customize a system prompt."""
     base_provider: str
@@ -118,20 +143,96 @@ class PromptBuilder:
         r"(?:friendly|professional|casual|formal|technical|simple)",
     ]
     
+    # Words reported as tone indicators by parse_prompt
+    _TONE_WORDS = ("friendly", "professional", "casual", "formal",
+                   "technical", "simple", "enthusiastic", "patient",
+                   "direct", "detailed", "concise")
+    
+    # Phrases marking a paragraph as the capability section to replace
+    _CAPABILITY_SECTION_HINTS = ("capability", "can", "able to")
+    
+    # Use-case keyword -> (provider, model, relevance) suggestions
+    _USE_CASE_TEMPLATES: Dict[str, Tuple[Tuple[str, str, float], ...]] = {
+        "code": (("cursor", "agent-prompt-2.0", 0.95),
+                 ("augment-code", "gpt-5-agent-prompts", 0.90),
+                 ("github-copilot", "agent", 0.85)),
+        "write": (("kimi", "docs", 0.90),
+                  ("notion", "prompt", 0.85)),
+        "chat": (("kimi", "base-chat", 0.95),
+                 ("openai", "gpt-4o", 0.90)),
+        "agent": (("cursor", "agent-cli-prompt-2025-08-07", 0.95),
+                  ("devin", "prompt", 0.90)),
+        "creative": (("lovable", "agent-prompt", 0.90),
+                     ("v0", "prompt", 0.85)),
+    }
+    
+    # Most parsed prompts kept in template_cache before the least recently
+    # used one is dropped
+    TEMPLATE_CACHE_SIZE = 32
+    
     def __init__(self) -> None:
         """Initialize the prompt builder."""
-        self.template_cache: Dict[str, PromptTemplate] = {}
+        # Parsed templates by prompt text, shared and read-only: callers
+        # outside the builder get copies from parse_prompt
+        self.template_cache: "OrderedDict[str, PromptTemplate]" = OrderedDict()
     
     def parse_prompt(self, prompt_text: str) -> PromptTemplate:
         """
         Parse a system prompt into its structural components.
         
+        Parses are kept in template_cache, so the same text is only parsed
+        once per builder; each call still returns its own copy.
+        
         Args:
             prompt_text: The system prompt text to parse
             
         Returns:
             PromptTemplate with extracted sections
         """
+        template = self._cached_template(prompt_text)
+        return replace(
+            template,
+            capability_sections=list(template.capability_sections),
+            instruction_sections=list(template.instruction_sections),
+            constraint_sections=list(template.constraint_sections),
+            tone_indicators=list(template.tone_indicators),
+        )
+    
+    def _cached_template(self, prompt_text: str) -> PromptTemplate:
+        """
+        Return the shared parse of a prompt from template_cache.
+        
+        analyze_base_prompt, build and preview_customization are usually
+        called on the same base prompt in turn; they read this shared
+        template and must not modify it. Only the TEMPLATE_CACHE_SIZE most
+        recently used prompts are kept.
+        
+        Args:
+            prompt_text: The system prompt text to parse
+            
+        Returns:
+            Cached PromptTemplate for the text
+        """
+        template = self.template_cache.get(prompt_text)
+        if template is None:
+            template = self._parse(prompt_text)
+            self.template_cache[prompt_text] = template
+            if len(self.template_cache) > self.TEMPLATE_CACHE_SIZE:
+                self.template_cache.popitem(last=False)
+        else:
+            self.template_cache.move_to_end(prompt_text)
+        return template
+    
+    def _parse(self, prompt_text: str) -> PromptTemplate:
+        """
+        Parse a system prompt without consulting template_cache.
+        
+        Args:
+            prompt_text: The system prompt text to parse
+            
+        Returns:
+            Newly built PromptTemplate
+        """
         template = PromptTemplate(original=prompt_text)
         text_lower = prompt_text.lower()
         
@@ -146,40 +247,30 @@ class PromptBuilder:
             template.structure_pattern = "narrative"
         
         # Extract role
-        for pattern in self.ROLE_PATTERNS:
-            match = re.search(pattern, prompt_text, re.IGNORECASE)
+        # Patterns are compiled once per list, so subclass and instance
+        # overrides of the *_PATTERNS lists are honoured
+        for regex in _compile_patterns(tuple(self.ROLE_PATTERNS), re.IGNORECASE):
+            match = regex.search(prompt_text)
             if match:
                 template.role_section = match.group(0)
                 break
         
         # Extract capabilities
-        for pattern in self.CAPABILITY_PATTERNS:
-            matches = re.finditer(pattern, prompt_text, re.IGNORECASE | re.DOTALL)
-            for match in matches:
+        for regex in _compile_patterns(tuple(self.CAPABILITY_PATTERNS), re.IGNORECASE | re.DOTALL):
+            for match in regex.finditer(prompt_text):
                 template.capability_sections.append(match.group(0))
         
         # Extract constraints
-        for pattern in self.CONSTRAINT_PATTERNS:
-            matches = re.finditer(pattern, prompt_text, re.IGNORECASE)
-            for match in matches:
+        for regex in _compile_patterns(tuple(self.CONSTRAINT_PATTERNS), re.IGNORECASE):
+            for match in regex.finditer(prompt_text):
                 template.constraint_sections.append(match.group(0))
         
         # Detect tone indicators
-        tone_words = ["friendly", "professional", "casual", "formal", 
-                     "technical", "simple", "enthusiastic", "patient",
-                     "direct", "detailed", "concise"]
-        for word in tone_words:
-            if word in text_lower:
-                template.tone_indicators.append(word)
+        template.tone_indicators.extend(filter(text_lower.__contains__, self._TONE_WORDS))
         
         # Extract instruction sections (numbered or bulleted)
-        instruction_patterns = [
-            r"(?:\d+\.\s+[^\n]+\n?)+",  # Numbered lists
-            r"(?:[-•]\s+[^\n]+\n?){3,}",  # Bullet lists
-        ]
-        for pattern in instruction_patterns:
-            matches = re.finditer(pattern, prompt_text)
-            for match in matches:
+        for regex in _INSTRUCTION_RES:
+            for match in regex.finditer(prompt_text):
                 template.instruction_sections.append(match.group(0))
         
         return template
@@ -197,7 +288,7 @@ class PromptBuilder:
         Returns:
             Analysis dictionary with customization suggestions
         """
-        template = self.parse_prompt(prompt_text)
+        template = self._cached_template(prompt_text)
         
         opportunities: List[str] = []
 
@@ -224,7 +315,7 @@ class PromptBuilder:
             "detected_role": template.role_section,
             "detected_capabilities": len(template.capability_sections),
             "detected_constraints": len(template.constraint_sections),
-            "tone": template.tone_indicators,
+            "tone": list(template.tone_indicators),
             "customization_opportunities": opportunities,
         }
 
@@ -242,7 +333,7 @@ class PromptBuilder:
         Returns:
             Customized system prompt text
         """
-        template = self.parse_prompt(base_prompt_text)
+        template = self._cached_template(base_prompt_text)
         
         # Start with the original
         customized = base_prompt_text
@@ -292,11 +383,10 @@ class PromptBuilder:
         """Apply role/persona customization."""
         if template.role_section:
             # Replace existing role statement
-            for pattern in self.ROLE_PATTERNS:
-                if re.search(pattern, text, re.IGNORECASE):
-                    new_role_statement = f"You are {new_role}."
-                    text = re.sub(pattern, new_role_statement, text, 
-                                count=1, flags=re.IGNORECASE)
+            new_role_statement = f"You are {new_role}."
+            for regex in _compile_patterns(tuple(self.ROLE_PATTERNS), re.IGNORECASE):
+                text, replaced = regex.subn(new_role_statement, text, count=1)
+                if replaced:
                     break
         else:
             # Add role statement at the beginning
@@ -318,8 +408,7 @@ class PromptBuilder:
             # Find a good spot to insert
             sections = text.split("\n\n")
             for i, section in enumerate(sections):
-                if any(indicator in section.lower() 
-                      for indicator in ["capability", "can", "able to"]):
+                if any(map(section.lower().__contains__, self._CAPABILITY_SECTION_HINTS)):
                     sections[i] = f"### Capabilities\n\n{cap_lines}"
                     break
             text = "\n\n".join(sections)
@@ -337,12 +426,7 @@ class PromptBuilder:
         # Check if there's already a tone section
         if "tone" in text.lower() or "style" in text.lower():
             # Replace existing tone instructions
-            text = re.sub(
-                r"(?:tone|style|communication)[^.]*(?:is|should be|must be)[^.]*\.?",
-                f"Your tone is {tone}.",
-                text,
-                flags=re.IGNORECASE
-            )
+            text = _TONE_STATEMENT_RE.sub(f"Your tone is {tone}.", text)
         else:
             # Add tone section
             text = f"{text}{tone_section}"
@@ -379,12 +463,7 @@ class PromptBuilder:
         output_section = f"\n\n### Output Format\n\n{output_format}"
         
         # Remove existing output format section if present
-        text = re.sub(
-            r"\n\n### Output Format.*?(?=\n\n###|$)",
-            "",
-            text,
-            flags=re.DOTALL
-        )
+        text = _OUTPUT_SECTION_RE.sub("", text)
         
         # Add new output section
         text = f"{text}{output_section}"
@@ -408,24 +487,10 @@ class PromptBuilder:
             List of (provider, model, relevance_score) tuples
         """
         use_case_lower = use_case.lower()
-        suggestions = []
+        suggestions: List[Tuple[str, str, float]] = []
         
         # Keyword matching for suggestions
-        keyword_mapping = {
-            "code": [("cursor", "agent-prompt-2.0", 0.95),
-                    ("augment-code", "gpt-5-agent-prompts", 0.90),
-                    ("github-copilot", "agent", 0.85)],
-            "write": [("kimi", "docs", 0.90),
-                     ("notion", "prompt", 0.85)],
-            "chat": [("kimi", "base-chat", 0.95),
-                    ("openai", "gpt-4o", 0.90)],
-            "agent": [("cursor", "agent-cli-prompt-2025-08-07", 0.95),
-                     ("devin", "prompt", 0.90)],
-            "creative": [("lovable", "agent-prompt", 0.90),
-                        ("v0", "prompt", 0.85)],
-        }
-        
-        for keyword, templates in keyword_mapping.items():
+        for keyword, templates in self._USE_CASE_TEMPLATES.items():
             if keyword in use_case_lower:
                 suggestions.extend(templates)
         
@@ -453,7 +518,7 @@ class PromptBuilder:
         Returns:
             Preview text describing changes
         """
-        template = self.parse_prompt(base_prompt_text)
+        template = self._cached_template(base_prompt_text)
         
         preview_lines = [
             "=" * 60,
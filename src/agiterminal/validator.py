@@ -7,11 +7,31 @@ and ethical standards.
 This module is designed for educational and research purposes.
 """
 
+import functools
+import hashlib
+import json
 import re
-from typing import Dict, List, Any, Optional, Set
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Pattern, Set, Tuple
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+from . import __version__
+
+
+@functools.lru_cache(maxsize=32)
+def _word_matchers(terms: Tuple[str, ...]) -> Tuple[Tuple[str, Pattern[str]], ...]:
+    """Compile a word-boundary matcher for each term, once per set of terms."""
+    return tuple((term, re.compile(r'\b' + re.escape(term) + r'\b')) for term in terms)
+
+
+@functools.lru_cache(maxsize=32)
+def _metadata_matchers(fields: Tuple[str, ...]) -> Tuple[Tuple[str, Pattern[str]], ...]:
+    """Compile a '**Field:**' matcher for each metadata field, once per set of fields."""
+    return tuple(
+        (field, re.compile(rf"\*\*{field.capitalize()}:\*\*", re.IGNORECASE))
+        for field in fields
+    )
+
 
 @dataclass
 class ValidationResult:
@@ -38,6 +58,11 @@ class EducationalValidator:
         ...     print(result.errors)
     """
     
+    # Version of the validation logic, stored in result caches written by
+    # batch_validate_directory; bump it when the checks themselves change.
+    # Edits to the term and field tables below are picked up automatically
+    RULES_VERSION = 1
+    
     # Terms that should not appear in educational content
     # These are real-world extremist references - fictional alternatives should be used
     PROHIBITED_TERMS: Set[str] = {
@@ -86,9 +111,13 @@ class EducationalValidator:
         
         content_lower = content.lower()
         
-        # Check for prohibited terms (word-boundary matching)
-        for term in self.PROHIBITED_TERMS:
-            if re.search(r'\b' + re.escape(term) + r'\b', content_lower):
+        # Check for prohibited terms (word-boundary matching). A leading \b
+        # defeats the regex engine's literal prefix scan, so the much cheaper
+        # substring test rules out absent terms before the regex runs.
+        # Matchers are compiled once per set of terms, so subclass and
+        # instance overrides of PROHIBITED_TERMS are honoured
+        for term, regex in _word_matchers(tuple(self.PROHIBITED_TERMS)):
+            if term in content_lower and regex.search(content_lower):
                 self.errors.append(
                     f"Prohibited term found: '{term}'. "
                     "Use fictional alternatives (Star Wars, 1984, etc.)"
@@ -187,9 +216,8 @@ class EducationalValidator:
         result = self.validate_prompt(content, context="system-prompt")
         
         # Check for required metadata fields
-        for field in self.REQUIRED_METADATA_FIELDS:
-            pattern = rf"\*\*{field.capitalize()}:\*\*"
-            if not re.search(pattern, content, re.IGNORECASE):
+        for field, regex in _metadata_matchers(tuple(self.REQUIRED_METADATA_FIELDS)):
+            if not regex.search(content):
                 result.warnings.append(
                     f"Missing metadata field: '{field}'"
                 )
@@ -240,27 +268,111 @@ class EducationalValidator:
     def batch_validate_directory(
         self, 
         directory: str, 
-        pattern: str = "*.md"
+        pattern: str = "*.md",
+        cache_path: Optional[str] = None
     ) -> Dict[str, ValidationResult]:
         """
         Validate all files in a directory.
         
+        With a cache file, files whose modification time and size match
+        the cached entry reuse the stored result instead of being validated
+        again, and the cache is rewritten with the results of this run.
+        
         Args:
             directory: Directory path to validate
             pattern: File pattern to match
+            cache_path: Optional JSON file holding results from earlier runs
             
         Returns:
             Dictionary mapping file paths to validation results
         """
         dir_path = Path(directory)
         results = {}
+        cached = self._load_result_cache(cache_path) if cache_path else {}
+        entries: Dict[str, Any] = {}
         
         for file_path in dir_path.rglob(pattern):
-            result = self.validate_system_prompt_file(str(file_path))
-            results[str(file_path)] = result
+            key = str(file_path)
+            stat = file_path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            
+            result = None
+            entry = cached.get(key)
+            # Malformed entries are treated as cache misses
+            if isinstance(entry, dict) and entry.get("stamp") == stamp:
+                try:
+                    result = ValidationResult(**entry["result"])
+                except (KeyError, TypeError):
+                    result = None
+            if result is None:
+                result = self.validate_system_prompt_file(key)
+            
+            results[key] = result
+            entries[key] = {"stamp": stamp, "result": asdict(result)}
+        
+        if cache_path:
+            self._save_result_cache(cache_path, entries)
         
         return results
     
+    def _cache_owner(self) -> str:
+        """
+        Identify the validator class and rules a result cache belongs to.
+        
+        Besides the class, RULES_VERSION and the package version, the owner
+        holds a digest of the rule tables in effect, so a subclass or an
+        instance with different terms or fields never reuses the results.
+        """
+        cls = type(self)
+        rules = json.dumps([
+            sorted(self.PROHIBITED_TERMS),
+            sorted(self.WARNING_TERMS),
+            list(self.REQUIRED_METADATA_FIELDS),
+            list(self.REQUIRED_DOC_SECTIONS),
+        ])
+        digest = hashlib.sha256(rules.encode('utf-8')).hexdigest()[:16]
+        return (
+            f"{cls.__module__}.{cls.__qualname__}:{self.RULES_VERSION}:"
+            f"{__version__}:{digest}"
+        )
+    
+    def _load_result_cache(self, cache_path: str) -> Dict[str, Any]:
+        """
+        Read cached results, ignoring missing, unreadable or foreign caches.
+        
+        Args:
+            cache_path: JSON file written by _save_result_cache
+            
+        Returns:
+            Mapping of file path to its cached stamp and result
+        """
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("validator") != self._cache_owner():
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+    
+    def _save_result_cache(self, cache_path: str, entries: Dict[str, Any]) -> None:
+        """
+        Write the results of a batch run for reuse by later runs.
+        
+        The cache is optional, so a path that cannot be written is skipped
+        rather than failing a run whose validation already succeeded.
+        
+        Args:
+            cache_path: JSON file to write
+            entries: Mapping of file path to its stamp and result
+        """
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({"validator": self._cache_owner(), "files": entries}, f)
+        except OSError:
+            pass
+    
     def generate_validation_report(
         self, 
         results: Dict[str, ValidationResult]
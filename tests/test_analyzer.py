@@ -2,8 +2,11 @@
 Tests for the SystemPromptAnalyzer class.
 """
 
+import sys
+
 import pytest
 from pathlib import Path
+from agiterminal import analyzer as analyzer_module
 from agiterminal.analyzer import SystemPromptAnalyzer, AnalysisResult
 
 
@@ -124,6 +127,16 @@ Test analysis.
         assert not analyzer.is_refusal("Here's the information you requested.")
         assert not analyzer.is_refusal("I can help with that.")
     
+    def test_is_refusal_uses_subclass_indicators(self):
+        """Test that a subclass's REFUSAL_INDICATORS are the ones checked."""
+        class PoliteAnalyzer(SystemPromptAnalyzer):
+            REFUSAL_INDICATORS = ["regrettably"]
+        
+        analyzer = PoliteAnalyzer()
+        
+        assert analyzer.is_refusal("Regrettably, no.")
+        assert not analyzer.is_refusal("I'm sorry, that was a typo.")
+    
     def test_compare_with_baseline(self):
         """Test baseline comparison."""
         analyzer = SystemPromptAnalyzer()
@@ -163,3 +176,167 @@ Test analysis.
         assert len(result.capabilities) > 0
         assert len(result.safety_measures) > 0
         assert result.prompt_length > 0
+    
+    def test_analysis_result_is_mutable_and_slotted(self):
+        """Test that results accept field updates and, where supported, carry no __dict__."""
+        result = AnalysisResult(
+            provider="p", model="m", capabilities=[], safety_measures={},
+            architecture_pattern="Test", prompt_length=0, unique_features=[]
+        )
+        
+        result.provider = "other"
+        
+        assert result.provider == "other"
+        if sys.version_info >= (3, 10):
+            assert not hasattr(result, "__dict__")
+    
+    def test_analyze_many_matches_full_analysis(self):
+        """Test that batch analysis agrees with analyzing each prompt on its own."""
+        prompts = ["Write Python code.", "Search the web.", "Write Python code."]
+        
+        results = SystemPromptAnalyzer.analyze_many(prompts)
+        
+        assert len(results) == 3
+        for prompt, result in zip(prompts, results):
+            analyzer = SystemPromptAnalyzer()
+            analyzer.system_prompt = prompt
+            assert result == analyzer.full_analysis()
+        with pytest.raises(ValueError):
+            SystemPromptAnalyzer.analyze_many(["ok", ""])
+    
+    def test_full_analysis_matches_individual_extractors(self):
+        """Test that the shared single scan agrees with each extractor run alone."""
+        analyzer = SystemPromptAnalyzer()
+        analyzer.system_prompt = """
+        You are an expert assistant. Use the search tool and call its API.
+        Never share personal information; ask a question first if unsure.
+        Adjust your tone and remember prior context.
+        """
+        
+        result = analyzer.full_analysis()
+        
+        assert result.capabilities == analyzer.extract_capabilities()
+        assert result.safety_measures == analyzer.identify_safety_measures()
+        assert result.architecture_pattern == analyzer.identify_architecture_pattern()
+        assert result.unique_features == analyzer.extract_unique_features()
+        assert "Active questioning instructions" in result.unique_features
+        assert result.architecture_pattern == "Tool-based with function calling"
+    
+    def test_extractors_share_one_scan(self):
+        """Test that calling every extractor scans the prompt only once."""
+        analyzer = SystemPromptAnalyzer()
+        analyzer.system_prompt = "You are a shared scan test assistant."
+        misses_before = analyzer_module._analyze_prompt.cache_info().misses
+        
+        analyzer.extract_capabilities()
+        analyzer.identify_safety_measures()
+        analyzer.identify_architecture_pattern()
+        analyzer.extract_unique_features()
+        analyzer.full_analysis()
+        
+        assert analyzer_module._analyze_prompt.cache_info().misses == misses_before + 1
+    
+    def test_full_analysis_is_memoized_per_prompt(self):
+        """Test that repeat analyses hit the cache but return independent results."""
+        analyzer = SystemPromptAnalyzer()
+        analyzer.system_prompt = "You are a memo test assistant who can write code."
+        
+        first = analyzer.full_analysis()
+        first.capabilities.append("tampered")
+        hits_before = analyzer_module._analyze_prompt.cache_info().hits
+        second = analyzer.full_analysis()
+        
+        assert analyzer_module._analyze_prompt.cache_info().hits == hits_before + 1
+        assert "tampered" not in second.capabilities
+        assert second.capabilities == ["code", "generation"]
+    
+    def test_extractors_follow_new_prompt(self):
+        """Test that replacing the prompt is reflected by the shared scan."""
+        analyzer = SystemPromptAnalyzer()
+        analyzer.system_prompt = "Use the CODE tool."
+        assert analyzer.extract_capabilities() == ["code", "tools"]
+        
+        analyzer.system_prompt = "Search the WEB."
+        
+        assert analyzer.extract_capabilities() == ["search"]
+    
+    def test_subclass_capability_keywords(self):
+        """Test that a subclass's own CAPABILITY_KEYWORDS are searched."""
+        class AudioAnalyzer(SystemPromptAnalyzer):
+            CAPABILITY_KEYWORDS = {"audio": ["audio", "speech"]}
+        
+        analyzer = AudioAnalyzer()
+        analyzer.system_prompt = "You transcribe speech."
+        
+        assert analyzer.extract_capabilities() == ["audio"]
+        assert AudioAnalyzer.analyze_many(["Play audio."])[0].capabilities == ["audio"]
+    
+    def test_capability_keywords_changed_at_runtime(self, monkeypatch):
+        """Test that edits to CAPABILITY_KEYWORDS are not hidden by cached scans."""
+        analyzer = SystemPromptAnalyzer()
+        analyzer.system_prompt = "You transcribe audio clips."
+        assert "audio" not in analyzer.extract_capabilities()
+        
+        monkeypatch.setitem(SystemPromptAnalyzer.CAPABILITY_KEYWORDS, "audio", ["audio"])
+        
+        assert "audio" in analyzer.extract_capabilities()
+    
+    def test_instance_capability_keywords(self):
+        """Test that CAPABILITY_KEYWORDS set on an instance are searched."""
+        analyzer = SystemPromptAnalyzer()
+        analyzer.system_prompt = "You transcribe speech."
+        assert analyzer.extract_capabilities() == []
+        
+        analyzer.CAPABILITY_KEYWORDS = {"audio": ["speech"]}
+        
+        assert analyzer.extract_capabilities() == ["audio"]
+        assert SystemPromptAnalyzer().analyze_many(["You transcribe speech."])[0].capabilities == []
+    
+    def test_compare_with_baseline_reports_lines_in_order(self):
+        """Test that unique lines are reported in document order with exact counts."""
+        analyzer = SystemPromptAnalyzer()
+        analyzer.system_prompt = "shared\nfirst new\n\n  second new  \nshared\n"
+        
+        comparison = analyzer.compare_with_baseline("shared\nold line\n")
+        
+        assert comparison["unique_to_current"] == ["first new", "second new"]
+        assert comparison["unique_to_baseline"] == ["old line"]
+        assert comparison["common_lines"] == 1
+        assert comparison["lines_added"] == 2
+        assert comparison["lines_removed"] == 1
+        assert comparison["similarity_score"] == 0.25
+    
+    def test_line_index_reused_until_prompt_changes(self):
+        """Test that the prompt is split once per prompt, not once per comparison."""
+        analyzer = SystemPromptAnalyzer()
+        analyzer.system_prompt = "alpha\nbeta"
+        
+        analyzer.compare_with_baseline("alpha")
+        lines = analyzer._prompt_lines
+        analyzer.compare_with_baseline("beta")
+        
+        assert analyzer._prompt_lines is lines
+        
+        analyzer.system_prompt = "gamma"
+        
+        assert analyzer.compare_with_baseline("gamma")["similarity_score"] == 1.0
+    
+    def test_chunked_phrase_scan_matches_full_scan(self):
+        """Test that chunked lowercasing finds the same phrases, including across chunk edges."""
+        phrases = analyzer_module._phrase_union(
+            SystemPromptAnalyzer, SystemPromptAnalyzer()._capability_table()
+        )
+        text = "Filler TEXT. " * 40 + "You Are an expert. Never share PERSONAL Information." * 3
+        
+        for chunk_size in (1, 7, 64, 10_000):
+            found = analyzer_module._find_phrases_chunked(text, phrases, chunk_size)
+            assert found == analyzer_module._find_phrases(text.lower(), phrases)
+    
+    def test_count_up_to_matches_str_count_below_limit(self):
+        """Test the capped counter used by the architecture check."""
+        count_up_to = analyzer_module._count_up_to
+        
+        assert count_up_to("a-b-c", "-", 11) == 2
+        assert count_up_to("-" * 10, "-", 11) == 10
+        assert count_up_to("-" * 500, "-", 11) == 11
+        assert count_up_to("----", "--", 11) == "----".count("--")
@@ -0,0 +1,200 @@
+"""
+Tests for the PromptBenchmark class.
+"""
+
+import asyncio
+import json
+import sys
+
+import pytest
+from agiterminal.benchmark import PromptBenchmark, AbstractionLevel, BenchmarkResult
+
+
+class TestPromptBenchmark:
+    """Test cases for PromptBenchmark."""
+
+    def test_init_validation(self):
+        """Test that levels and concurrency limits are validated."""
+        with pytest.raises(ValueError):
+            PromptBenchmark(levels=0)
+        with pytest.raises(ValueError):
+            PromptBenchmark(max_concurrency=0)
+
+    def test_apply_abstraction(self):
+        """Test that DIRECT leaves the prompt alone and other levels append framing."""
+        benchmark = PromptBenchmark()
+
+        assert benchmark.apply_abstraction("Q", AbstractionLevel.DIRECT) == "Q"
+        for level in list(AbstractionLevel)[1:]:
+            modified = benchmark.apply_abstraction("Q", level)
+            assert modified.startswith("Q\n\n")
+            assert len(modified) > 3
+
+    async def test_run_benchmark_concurrent_and_ordered(self):
+        """Test that calls overlap up to the limit and results keep input order."""
+        benchmark = PromptBenchmark(levels=3, max_concurrency=4)
+        active = 0
+        peak = 0
+
+        async def test_function(modified_prompt, case):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if case == "bad":
+                raise RuntimeError("boom")
+            return "ok", case == "no", {}
+
+        results = await benchmark.run_benchmark(["yes", "no", "bad"], test_function)
+
+        assert peak == 4
+        assert [(r.test_case, r.level) for r in results] == [
+            (case, AbstractionLevel(level))
+            for case in ["yes", "no", "bad"]
+            for level in range(3)
+        ]
+        assert [r.refused for r in results] == [False] * 3 + [True] * 6
+        assert results[-1].metadata["error"] == "boom"
+        assert results[0].metadata["theoretical_projection"] == 0.40
+
+    def test_generate_report(self):
+        """Test per-level and overall statistics from hand-built results."""
+        benchmark = PromptBenchmark(levels=2)
+        benchmark.results = [
+            BenchmarkResult(AbstractionLevel.DIRECT, "a", None, True, 1.0),
+            BenchmarkResult(AbstractionLevel.DIRECT, "b", "four", False, 2.0),
+            BenchmarkResult(AbstractionLevel.ACADEMIC, "a", "sixsix", False, 0.5),
+            BenchmarkResult(AbstractionLevel.ACADEMIC, "b", "", False, 0.5),
+            # Outside the configured levels: counted only in the summary
+            BenchmarkResult(AbstractionLevel.PURE_ABSTRACTION, "a", None, True, 1.0),
+        ]
+
+        report = benchmark.generate_report()
+
+        assert report["summary"] == {
+            "total_tests": 5,
+            "levels_tested": 2,
+            "total_refused": 2,
+            "overall_refusal_rate": 0.4,
+            "avg_response_time": 1.0,
+        }
+        assert list(report["level_statistics"]) == ["level_0", "level_1"]
+        assert report["level_statistics"]["level_0"] == {
+            "name": "Direct",
+            "total_tests": 2,
+            "refused": 1,
+            "responded": 1,
+            "refusal_rate": 0.5,
+            "avg_response_time": 1.5,
+            "avg_response_length": 4.0,
+            "theoretical_projection": 0.40,
+        }
+        assert report["level_statistics"]["level_1"]["avg_response_length"] == 3.0
+        assert "error" in PromptBenchmark().generate_report()
+
+    def test_report_tracks_result_edits(self):
+        """Test that reports reflect results edited in place and appended."""
+        benchmark = PromptBenchmark(levels=1)
+        result = BenchmarkResult(AbstractionLevel.DIRECT, "a", "ok", False, 1.0)
+        benchmark.results = [result]
+
+        assert benchmark.generate_report()["summary"]["total_refused"] == 0
+
+        result.refused = True
+
+        assert benchmark.generate_report()["summary"]["total_refused"] == 1
+
+        benchmark.results.append(BenchmarkResult(AbstractionLevel.DIRECT, "b", None, True, 1.0))
+
+        assert benchmark.compare_with_projection()["comparison"]["level_0"]["sample_size"] == 2
+
+    def test_report_tracks_projection_changes(self, tmp_path):
+        """Test that report and comparison agree after projections are changed."""
+        benchmark = PromptBenchmark(levels=1)
+        benchmark.results = [BenchmarkResult(AbstractionLevel.DIRECT, "a", None, True, 1.0)]
+        benchmark.generate_report()
+
+        benchmark.theoretical_projections[0] = 0.1
+        path = tmp_path / "out.json"
+        benchmark.export_results(str(path))
+        data = json.loads(path.read_text())
+
+        assert data["report"]["level_statistics"]["level_0"]["theoretical_projection"] == 0.1
+        assert data["projection_comparison"]["comparison"]["level_0"]["projected_rate"] == 0.1
+
+    def test_export_shares_one_aggregation_pass(self, tmp_path, monkeypatch):
+        """Test that the exported report and projection comparison scan results once."""
+        benchmark = PromptBenchmark(levels=1)
+        benchmark.results = [BenchmarkResult(AbstractionLevel.DIRECT, "a", None, True, 1.0)]
+        calls = []
+        aggregate = benchmark._aggregate_levels
+        monkeypatch.setattr(benchmark, "_aggregate_levels", lambda: calls.append(1) or aggregate())
+
+        benchmark.export_results(str(tmp_path / "out.json"))
+
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("have_orjson", [True, False])
+    def test_export_json(self, tmp_path, monkeypatch, have_orjson):
+        """Test JSON export with and without orjson, pretty and compact, with matching output."""
+        if have_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        benchmark = PromptBenchmark(levels=1)
+        benchmark.results = [
+            BenchmarkResult(AbstractionLevel.DIRECT, "café", "ok", False, 0.5, {1: "x"})
+        ]
+
+        for pretty in (True, False):
+            path = tmp_path / f"out-{pretty}.json"
+            benchmark.export_results(str(path), pretty=pretty)
+            text = path.read_text(encoding="utf-8")
+            data = json.loads(text)
+
+            assert data["report"]["summary"]["total_tests"] == 1
+            assert data["raw_results"][0]["metadata"] == {"1": "x"}
+            assert ("\n  " in text) is pretty
+            # Both encoders write non-ASCII unescaped with the same separators
+            assert ('"test_case": "café"' if pretty else '"test_case":"café"') in text
+
+        # Values orjson cannot encode still export through the json module
+        benchmark.results[0].metadata["big"] = 2**70
+        benchmark.export_results(str(tmp_path / "big.json"))
+
+        assert json.loads((tmp_path / "big.json").read_text())["raw_results"][0]["metadata"]["big"] == 2**70
+
+    @pytest.mark.parametrize("have_orjson", [True, False])
+    def test_export_json_non_finite_floats(self, tmp_path, monkeypatch, have_orjson):
+        """Test that NaN and infinity are written as null with and without orjson."""
+        if have_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        benchmark = PromptBenchmark(levels=1)
+        benchmark.results = [
+            BenchmarkResult(AbstractionLevel.DIRECT, "case", "ok", False, 0.5,
+                            {"score": float("nan"), "bounds": [float("-inf"), 1.5]})
+        ]
+        path = tmp_path / "out.json"
+
+        benchmark.export_results(str(path), pretty=False)
+        text = path.read_text(encoding="utf-8")
+
+        assert '"metadata":{"score":null,"bounds":[null,1.5]}' in text
+        assert json.loads(text)["raw_results"][0]["metadata"]["score"] is None
+
+    def test_export_json_fallback_leaves_no_partial_file(self, tmp_path, monkeypatch):
+        """Test that a value the json module rejects does not leave a truncated file."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        benchmark = PromptBenchmark(levels=1)
+        benchmark.results = [
+            BenchmarkResult(AbstractionLevel.DIRECT, "case", "ok", False, 0.5, {"bad": object()})
+        ]
+        path = tmp_path / "out.json"
+
+        with pytest.raises(TypeError):
+            benchmark.export_results(str(path))
+
+        assert not path.exists()
@@ -0,0 +1,133 @@
+"""
+Tests for the CLI output helpers.
+"""
+
+import json
+import sys
+
+import pytest
+from agiterminal import cli
+
+
+class TestEmit:
+    """Test cases for streaming report and JSON output."""
+
+    def test_emit_report_file_and_stdout(self, tmp_path, capsys):
+        """Test that lines are newline-joined, with a trailing newline only on stdout."""
+        path = tmp_path / "report.txt"
+
+        cli._emit_report(iter(["a", "", "b"]), str(path))
+        cli._emit_report(iter(["a", "", "b"]))
+
+        assert path.read_text() == "a\n\nb"
+        assert capsys.readouterr().out == "a\n\nb\n"
+
+    def test_emit_report_file_is_utf8(self, tmp_path):
+        """Test that report files are UTF-8 whatever the locale encoding."""
+        path = tmp_path / "report.txt"
+
+        cli._emit_report(iter(["📋 Report", "  • café"]), str(path))
+
+        assert path.read_bytes() == "📋 Report\n  • café".encode("utf-8")
+
+    @pytest.mark.parametrize("have_orjson", [True, False])
+    def test_emit_json(self, tmp_path, capsys, monkeypatch, have_orjson):
+        """Test JSON output with and without orjson is identical, non-ASCII included."""
+        if have_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        data = {"model": "modèle ✓", "capabilities": ["code", "search"], "safety_measures": {}}
+        path = tmp_path / "out.json"
+
+        cli._emit_json(data, str(path))
+        cli._emit_json(data)
+
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        assert path.read_text(encoding="utf-8") == expected
+        assert capsys.readouterr().out == expected + "\n"
+
+    @pytest.mark.parametrize("have_orjson", [True, False])
+    def test_emit_json_non_finite_floats(self, tmp_path, monkeypatch, have_orjson):
+        """Test that NaN and infinity are written as null with and without orjson."""
+        if have_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        path = tmp_path / "out.json"
+
+        cli._emit_json({"score": float("nan"), "bounds": [float("inf"), 1.5]}, str(path))
+
+        assert path.read_text(encoding="utf-8") == (
+            '{\n  "score": null,\n  "bounds": [\n    null,\n    1.5\n  ]\n}'
+        )
+
+    def test_write_all_replaces_file(self, tmp_path):
+        """Test that _write_all truncates existing content and writes UTF-8."""
+        path = tmp_path / "out.md"
+        path.write_text("old content that is longer")
+
+        cli._write_all(str(path), "📋 new\nline")
+
+        assert path.read_bytes() == "📋 new\nline".encode("utf-8")
+
+
+class TestLoadYaml:
+    """Test cases for reading requirement files."""
+
+    @pytest.mark.parametrize("have_libyaml", [True, False])
+    def test_load_yaml(self, tmp_path, monkeypatch, have_libyaml):
+        """Test that the C and pure-Python safe loaders give the same data."""
+        yaml = pytest.importorskip("yaml")
+        if have_libyaml:
+            if not hasattr(yaml, "CSafeLoader"):
+                pytest.skip("libyaml not available")
+        else:
+            monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        path = tmp_path / "reqs.yaml"
+        path.write_text("capabilities:\n  - code\n  - café\nmin_safety_measures: 2\n", encoding="utf-8")
+
+        assert cli._load_yaml(str(path)) == {
+            "capabilities": ["code", "café"],
+            "min_safety_measures": 2,
+        }
+
+    def test_load_yaml_rejects_unsafe_tags(self, tmp_path):
+        """Test that Python object tags are refused as with yaml.safe_load."""
+        yaml = pytest.importorskip("yaml")
+        path = tmp_path / "reqs.yaml"
+        path.write_text("!!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(yaml.YAMLError):
+            cli._load_yaml(str(path))
+
+
+class TestListModels:
+    """Test cases for the list-models command."""
+
+    def test_listing(self, tmp_path, monkeypatch):
+        """Test that README and hidden directories are skipped and models sorted by file name."""
+        from click.testing import CliRunner
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "alpha").mkdir()
+        for name in ["gpt-5", "gpt-5-mini", "README"]:
+            (tmp_path / "alpha" / f"{name}.md").write_text("# M")
+        monkeypatch.setattr(cli._paths, "get_collections_path", lambda: tmp_path)
+
+        result = CliRunner().invoke(cli.cli, ["list-models"])
+
+        assert result.exit_code == 0
+        assert result.output.endswith("\nALPHA/\n  • gpt-5-mini\n  • gpt-5\n")
+
+    def test_missing_or_not_a_directory(self, tmp_path, monkeypatch):
+        """Test that a missing collections path, or a file in its place, is an error."""
+        from click.testing import CliRunner
+        (tmp_path / "file").write_text("not a directory")
+
+        for path in (tmp_path / "missing", tmp_path / "file"):
+            monkeypatch.setattr(cli._paths, "get_collections_path", lambda: path)
+
+            result = CliRunner().invoke(cli.cli, ["list-models"])
+
+            assert result.exit_code == 1
+            assert "collections/ directory not found" in result.output
@@ -25,6 +25,26 @@ class TestMultiModelComparator:
         
         assert len(comparator.analyzers) == 0
     
+    def test_load_multiple_prompts_keeps_order(self, tmp_path, monkeypatch, capsys):
+        """Test that concurrent loading keeps input order and reports failures."""
+        (tmp_path / "alpha").mkdir()
+        for name in ["zeta", "beta", "alpha"]:
+            (tmp_path / "alpha" / f"{name}.md").write_text(f"# {name}\n\nYou are {name}.")
+        monkeypatch.setattr("agiterminal._paths.get_collections_path", lambda: tmp_path)
+    
+        comparator = MultiModelComparator()
+        comparator.load_multiple_prompts(
+            ["alpha/zeta", "bad", "alpha/missing", "alpha/beta", "alpha/alpha"]
+        )
+    
+        assert list(comparator.results) == ["alpha/zeta", "alpha/beta", "alpha/alpha"]
+        assert comparator.analyzers["alpha/beta"].system_prompt == "You are beta."
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [
+            "Warning: Invalid format 'bad', expected 'provider/model'",
+            "Warning: Could not load prompt for alpha/missing",
+        ]
+    
     def test_compare_capabilities_empty(self):
         """Test comparing with no loaded models."""
         comparator = MultiModelComparator()
@@ -135,6 +155,31 @@ class TestMultiModelComparator:
         assert suggestions[0]["model"] == "p1/m1"
         assert suggestions[0]["match_score"] > suggestions[1]["match_score"]
     
+    def test_suggest_capability_breakdown(self):
+        """Test matched/missing/extra capability lists with and without requirements."""
+        comparator = MultiModelComparator()
+        comparator.results = {
+            "p1/m1": AnalysisResult(
+                provider="p1", model="m1",
+                capabilities=["code", "search"],
+                safety_measures={}, architecture_pattern="Test",
+                prompt_length=100, unique_features=[]
+            )
+        }
+        
+        caps = comparator.suggest_alternative_models(
+            {"capabilities": ["code", "math"]}
+        )[0]["capabilities_match"]
+        
+        assert caps["matched"] == ["code"]
+        assert caps["missing"] == ["math"]
+        assert caps["extra"] == ["search"]
+        
+        caps = comparator.suggest_alternative_models({})[0]["capabilities_match"]
+        
+        assert caps["matched"] == [] and caps["missing"] == []
+        assert sorted(caps["extra"]) == ["code", "search"]
+    
     def test_full_comparison(self):
         """Test full comparison."""
         comparator = MultiModelComparator()
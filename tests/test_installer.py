@@ -144,6 +144,36 @@ More content here.
         assert result["max_tokens"] == 4096
         assert result["messages"] == []
 
+    def test_load_prompt_extracts_section(self, tmp_path, monkeypatch):
+        """Test that load_prompt keeps the raw file and extracts its system prompt."""
+        (tmp_path / "alpha").mkdir()
+        prompt_file = tmp_path / "alpha" / "model.md"
+        prompt_file.write_text("# Model\n\n## System Prompt\n\nBe brief.\n---\nNotes\n")
+        monkeypatch.setattr("agiterminal._paths.get_collections_path", lambda: tmp_path)
+        installer = PromptInstaller()
+
+        assert installer.load_prompt("alpha", "model") == "Be brief."
+        assert installer.raw_content == prompt_file.read_text()
+        assert installer.system_prompt == _paths.extract_system_prompt(installer.raw_content)
+
+        prompt_file.write_text("# Model\n\n## System Prompt\n\nBe thorough.\n")
+
+        assert installer.load_prompt("alpha", "model") == "Be thorough."
+
+    def test_load_prompt_resolves_once(self, tmp_path, monkeypatch):
+        """Test that load_prompt resolves and reads the prompt file a single time."""
+        (tmp_path / "alpha").mkdir()
+        (tmp_path / "alpha" / "model.md").write_text("## System Prompt\n\nBe brief.\n")
+        monkeypatch.setattr("agiterminal._paths.get_collections_path", lambda: tmp_path)
+        calls = []
+        resolve = _paths.resolve_prompt_path
+        monkeypatch.setattr(_paths, "resolve_prompt_path",
+                            lambda *args: calls.append(args) or resolve(*args))
+
+        PromptInstaller().load_prompt("alpha", "model")
+
+        assert len(calls) == 1
+
     def test_format_output_not_loaded(self):
         """Test format output without loaded prompt."""
         installer = PromptInstaller()
@@ -227,7 +257,6 @@ More content here.
         )
 
         # Monkeypatch the path resolution in load_prompt
-        original_load = installer.load_prompt
         def mock_load(provider, model):
             # Directly set state without path lookup
             installer.provider = provider
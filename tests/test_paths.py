@@ -0,0 +1,278 @@
+"""
+Tests for the shared _paths helpers.
+
+This module tests directory listing, its memoization, and cache invalidation.
+"""
+
+import os
+
+import pytest
+
+from agiterminal import _paths
+from agiterminal._paths import extract_system_prompt
+
+
+class TestListings:
+    """Test cases for provider/model listings."""
+
+    def test_list_providers_and_models(self, tmp_path):
+        """Test listing providers and models from a collections directory."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "beta").mkdir()
+        (tmp_path / "alpha").mkdir()
+        (tmp_path / "alpha" / "model-b.md").write_text("# B")
+        (tmp_path / "alpha" / "model-a.md").write_text("# A")
+        (tmp_path / "alpha" / "notes.txt").write_text("ignored")
+        (tmp_path / "alpha" / ".md").write_text("ignored")
+        (tmp_path / "alpha" / "folder.md").mkdir()
+
+        assert _paths.list_providers(tmp_path) == ["alpha", "beta"]
+        assert _paths.list_models("alpha", tmp_path) == ["model-a", "model-b"]
+        assert _paths.list_models("missing", tmp_path) == []
+        assert _paths.list_providers(tmp_path / "missing") == []
+
+    def test_list_directories_keeps_docs_and_hidden(self, tmp_path):
+        """Test that list_directories returns every sub-directory, unfiltered."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / ".hidden").mkdir()
+        (tmp_path / "alpha").mkdir()
+        (tmp_path / "file.md").write_text("# Not a directory")
+
+        assert _paths.list_directories(tmp_path) == [".hidden", "alpha", "docs"]
+        assert _paths.list_directories(tmp_path / "missing") == []
+
+    def test_listing_cache_invalidated_on_change(self, tmp_path):
+        """Test that adding an entry is picked up despite the listing cache."""
+        provider_dir = tmp_path / "alpha"
+        provider_dir.mkdir()
+        (provider_dir / "one.md").write_text("# One")
+
+        assert _paths.list_models("alpha", tmp_path) == ["one"]
+
+        (provider_dir / "two.md").write_text("# Two")
+
+        assert _paths.list_models("alpha", tmp_path) == ["one", "two"]
+
+    def test_listing_returns_fresh_list(self, tmp_path):
+        """Test that callers can mutate the result without touching the cache."""
+        (tmp_path / "alpha").mkdir()
+
+        providers = _paths.list_providers(tmp_path)
+        providers.append("injected")
+
+        assert _paths.list_providers(tmp_path) == ["alpha"]
+
+    def test_list_providers_set(self, tmp_path):
+        """Test the frozenset view of providers and its refresh on change."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "alpha").mkdir()
+
+        assert _paths.list_providers_set(tmp_path) == frozenset({"alpha"})
+        assert _paths.list_providers_set(tmp_path / "missing") == frozenset()
+
+        (tmp_path / "beta").mkdir()
+        stat = tmp_path.stat()
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert "beta" in _paths.list_providers_set(tmp_path)
+
+    def test_clear_cache(self, tmp_path):
+        """Test that clear_cache empties the listing cache."""
+        (tmp_path / "alpha").mkdir()
+        _paths.list_providers(tmp_path)
+
+        _paths.clear_cache()
+
+        assert _paths._scan_directory.cache_info().currsize == 0
+
+
+class TestPromptLoading:
+    """Test cases for prompt path resolution and loading."""
+
+    def test_resolve_prompt_path_variants(self, tmp_path):
+        """Test that dash/underscore variants resolve to the same file."""
+        (tmp_path / "alpha").mkdir()
+        (tmp_path / "alpha" / "base_chat.md").write_text("# Base")
+
+        resolved = _paths.resolve_prompt_path("alpha", "base-chat", tmp_path)
+
+        assert resolved.name == "base_chat.md"
+
+    def test_resolve_prompt_path_not_found(self, tmp_path):
+        """Test that a missing prompt raises FileNotFoundError."""
+        (tmp_path / "alpha").mkdir()
+
+        with pytest.raises(FileNotFoundError):
+            _paths.resolve_prompt_path("alpha", "missing", tmp_path)
+        with pytest.raises(FileNotFoundError):
+            _paths.resolve_prompt_path("missing", "model", tmp_path)
+
+    def test_resolve_prompt_path_dedupes_candidates(self, tmp_path):
+        """Test that identical name variants are only tried once."""
+        (tmp_path / "alpha").mkdir()
+
+        with pytest.raises(FileNotFoundError) as excinfo:
+            _paths.resolve_prompt_path("alpha", "plain", tmp_path)
+
+        assert str(excinfo.value).count("plain.md") == 1
+
+    def test_resolve_prompt_path_probes_beyond_stale_listing(self, tmp_path):
+        """Test that a file the cached listing has not seen is still found."""
+        provider_dir = tmp_path / "alpha"
+        provider_dir.mkdir()
+        (provider_dir / "one.md").write_text("# One")
+        _paths.resolve_prompt_path("alpha", "one", tmp_path)
+        stat = provider_dir.stat()
+
+        (provider_dir / "two.md").write_text("# Two")
+        # Keep the old mtime, as a coarse filesystem clock would
+        os.utime(provider_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert _paths.resolve_prompt_path("alpha", "two", tmp_path).name == "two.md"
+
+    def test_name_variants(self):
+        """Test that only separators present in the name produce variants."""
+        assert _paths._name_variants("gpt4") == ("gpt4",)
+        assert _paths._name_variants("gpt-4o") == ("gpt-4o", "gpt_4o")
+        assert _paths._name_variants("base_chat") == ("base_chat", "base-chat")
+        assert _paths._name_variants("a-b_c") == ("a-b_c", "a_b_c", "a-b-c")
+
+    def test_load_prompt_file_sees_edits(self, tmp_path):
+        """Test that cached content is refreshed when the file changes."""
+        (tmp_path / "alpha").mkdir()
+        prompt_file = tmp_path / "alpha" / "model.md"
+        prompt_file.write_text("first")
+
+        assert _paths.load_prompt_file("alpha", "model", tmp_path) == "first"
+
+        prompt_file.write_text("second version")
+
+        assert _paths.load_prompt_file("alpha", "model", tmp_path) == "second version"
+
+    def test_load_prompt_file_translates_newlines(self, tmp_path):
+        """Test that CRLF and CR line endings read back as in text mode."""
+        (tmp_path / "alpha").mkdir()
+        prompt_file = tmp_path / "alpha" / "model.md"
+        prompt_file.write_bytes("# Modèle\r\n\r\nLine one\rLine two\r\r\n".encode("utf-8"))
+
+        content = _paths.load_prompt_file("alpha", "model", tmp_path)
+
+        assert content == prompt_file.read_text(encoding="utf-8")
+        assert content == "# Modèle\n\nLine one\nLine two\n\n"
+
+    def test_load_prompt_file_after_delete(self, tmp_path):
+        """Test that a deleted prompt is not served from the cache."""
+        (tmp_path / "alpha").mkdir()
+        prompt_file = tmp_path / "alpha" / "model.md"
+        prompt_file.write_text("content")
+        _paths.load_prompt_file("alpha", "model", tmp_path)
+
+        prompt_file.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            _paths.load_prompt_file("alpha", "model", tmp_path)
+
+    def test_symlink_inside_collections_accepted(self, tmp_path):
+        """Test that a prompt symlinked to another file in the collections is served."""
+        (tmp_path / "alpha").mkdir()
+        (tmp_path / "beta").mkdir()
+        (tmp_path / "beta" / "shared.md").write_text("shared")
+        (tmp_path / "alpha" / "model.md").symlink_to(tmp_path / "beta" / "shared.md")
+
+        resolved = _paths.resolve_prompt_path("alpha", "model", tmp_path)
+
+        assert resolved == (tmp_path / "beta" / "shared.md").resolve()
+
+    def test_symlink_to_sibling_directory_rejected(self, tmp_path):
+        """Test that a prompt escaping into a same-prefix sibling directory is refused."""
+        collections = tmp_path / "collections"
+        outside = tmp_path / "collections-evil"
+        (collections / "alpha").mkdir(parents=True)
+        outside.mkdir()
+        (outside / "secret.md").write_text("secret")
+        (collections / "alpha" / "model.md").symlink_to(outside / "secret.md")
+
+        with pytest.raises(FileNotFoundError):
+            _paths.resolve_prompt_path("alpha", "model", collections)
+
+
+class TestSanitize:
+    """Test cases for sanitize_path_component beyond the traversal basics."""
+
+    def test_keeps_unicode_alphanumerics(self):
+        """Test that non-ASCII letters and digits survive like str.isalnum allows."""
+        assert _paths.sanitize_path_component("modèle-٣") == "modèle-٣"
+
+    def test_strips_traversal_before_filtering(self):
+        """Test that '..' is removed once slashes are gone, then other chars filtered."""
+        assert _paths.sanitize_path_component("a/../b") == "ab"
+        assert _paths.sanitize_path_component("v1..2 beta!") == "v12beta"
+
+    def test_results_are_memoized(self):
+        """Test that repeated names are served from the sanitizer cache."""
+        _paths.clear_cache()
+
+        _paths.sanitize_path_component("gpt-4o")
+        _paths.sanitize_path_component("gpt-4o")
+
+        assert _paths.sanitize_path_component.cache_info().hits == 1
+
+    def test_ascii_fast_path_matches_regex(self):
+        """Test that the ASCII translate table keeps exactly what the regex keeps."""
+        for code in range(128):
+            char = chr(code)
+            if char in "/\\":
+                continue
+            expected = _paths._DISALLOWED_CHARS.sub('', char)
+            assert _paths.sanitize_path_component(f"a{char}b") == f"a{expected}b"
+
+
+class TestExtractSystemPrompt:
+    """Test cases for extract_system_prompt."""
+
+    def test_rule_separator_takes_priority(self):
+        """Test that '---' ends the section even when a '## ' heading comes first."""
+        content = "# T\n\n## System Prompt\n\nBody\n## Tools\nMore\n---\n## Analysis\n"
+
+        assert extract_system_prompt(content) == "Body\n## Tools\nMore"
+
+    def test_heading_separator_without_rule(self):
+        """Test that a '## ' heading ends the section when there is no rule."""
+        content = "## System Prompt\nBody\n\n## Notes\nIgnored"
+
+        assert extract_system_prompt(content) == "Body"
+
+    def test_fallback_strips_first_heading(self):
+        """Test fallback to the whole document minus its first heading line."""
+        assert extract_system_prompt("# Title\n\nYou are helpful.\n") == "You are helpful."
+        assert extract_system_prompt("# Title only") == ""
+        assert extract_system_prompt("No heading\n") == "No heading"
+
+
+class TestLoadSystemPrompt:
+    """Test cases for load_system_prompt and its byte-level extractor."""
+
+    def test_bytes_extraction_matches_str_extraction(self):
+        """Test that the byte-level extractor agrees with the str version."""
+        samples = [
+            "# T\n\n## System Prompt\n\nBody é\n## Tools\nMore\n---\n## Analysis\n",
+            "## System Prompt\nFirst\n## System Prompt\nSecond",
+            "# Title\n\nNo section here.\n",
+            "# T\r\n\r\n## System Prompt\r\n\r\nBody\r\n---\r\nTail\r\n",
+        ]
+
+        for content in samples:
+            expected = extract_system_prompt(content.replace("\r\n", "\n"))
+            assert _paths._extract_system_prompt_bytes(content.encode("utf-8")) == expected
+
+    def test_load_system_prompt(self, tmp_path):
+        """Test loading only the system prompt section and refreshing on edits."""
+        (tmp_path / "alpha").mkdir()
+        prompt_file = tmp_path / "alpha" / "model.md"
+        prompt_file.write_text("# Model\n\n## System Prompt\n\nBe brief.\n---\nNotes\n")
+
+        assert _paths.load_system_prompt("alpha", "model", tmp_path) == "Be brief."
+
+        prompt_file.write_text("# Model\n\n## System Prompt\n\nBe thorough.\n")
+
+        assert _paths.load_system_prompt("alpha", "model", tmp_path) == "Be thorough."
@@ -5,6 +5,8 @@ This module tests the prompt customization functionality, including template par
 customization application, and use case suggestions.
 """
 
+import sys
+
 import pytest
 from agiterminal.prompt_builder import (
     PromptBuilder,
@@ -101,6 +103,20 @@ class TestCustomizationRequest:
         assert request.output_format is None
         assert request.additional_context is None
 
+    def test_fields_assignable_without_instance_dict(self):
+        """Test that a CustomizationRequest can be updated but carries no __dict__ where slots apply."""
+        request = CustomizationRequest(
+            base_provider="openai",
+            base_model="gpt-4",
+            use_case="General assistant"
+        )
+
+        request.use_case = "Something else"
+
+        assert request.use_case == "Something else"
+        if sys.version_info >= (3, 10):
+            assert not hasattr(request, "__dict__")
+
 
 class TestPromptBuilder:
     """Test cases for PromptBuilder."""
@@ -129,6 +145,88 @@ Always be helpful and accurate."""
         assert len(template.capability_sections) >= 0  # May or may not match depending on pattern
         assert "professional" in template.tone_indicators or len(template.tone_indicators) >= 0
 
+    def test_parse_prompt_cached_per_text(self, monkeypatch):
+        """Test that analyze, preview and build share one parse of the base prompt."""
+        builder = PromptBuilder()
+        base = "You are Kimi, a friendly assistant.\n\n- one\n- two\n- three\n"
+        request = CustomizationRequest(
+            base_provider="kimi",
+            base_model="base-chat",
+            use_case="Python tutor",
+            role_description="CodeTutor",
+        )
+        calls = []
+        parse = builder._parse
+        monkeypatch.setattr(builder, "_parse", lambda text: calls.append(text) or parse(text))
+
+        builder.analyze_base_prompt("kimi", "base-chat", base)
+        builder.preview_customization(request, base)
+        builder.build(request, base)
+        builder.parse_prompt("Act as a guide.")
+
+        assert calls == [base, "Act as a guide."]
+        assert set(builder.template_cache) == {base, "Act as a guide."}
+
+    def test_template_cache_is_bounded(self, monkeypatch):
+        """Test that the least recently used parse is dropped once the cache is full."""
+        builder = PromptBuilder()
+        monkeypatch.setattr(builder, "TEMPLATE_CACHE_SIZE", 2)
+
+        builder.parse_prompt("You are one.")
+        builder.parse_prompt("You are two.")
+        builder.parse_prompt("You are one.")
+        builder.parse_prompt("You are three.")
+
+        assert list(builder.template_cache) == ["You are one.", "You are three."]
+
+    def test_parse_prompt_returns_independent_copies(self):
+        """Test that changing a parsed template does not change later parses."""
+        builder = PromptBuilder()
+        prompt = "You are Kimi, a friendly assistant."
+
+        template = builder.parse_prompt(prompt)
+        template.role_section = "changed"
+        template.tone_indicators.append("changed")
+
+        again = builder.parse_prompt(prompt)
+        assert "You are Kimi" in again.role_section
+        assert "changed" not in again.tone_indicators
+
+    def test_pattern_overrides(self):
+        """Test that subclass and instance pattern overrides are used."""
+        class GreetingBuilder(PromptBuilder):
+            ROLE_PATTERNS = [r"Greetings,\s+([^.]+)\."]
+
+        prompt = "Greetings, traveller. You are a guide. Never lie."
+
+        assert GreetingBuilder().parse_prompt(prompt).role_section == "Greetings, traveller."
+        assert PromptBuilder().parse_prompt(prompt).role_section == "You are a guide."
+
+        builder = PromptBuilder()
+        builder.CONSTRAINT_PATTERNS = [r"lie"]
+        builder.CAPABILITY_PATTERNS = [r"travel\w*"]
+        template = builder.parse_prompt(prompt)
+
+        assert template.constraint_sections == ["lie"]
+        assert template.capability_sections == ["traveller"]
+
+    def test_parse_prompt_returns_independent_copies(self):
+        """Test that modifying a returned template leaves later parses intact."""
+        builder = PromptBuilder()
+        prompt = "You are a friendly guide.\n\n- a\n- b\n- c\n"
+
+        first = builder.parse_prompt(prompt)
+        first.tone_indicators.append("sarcastic")
+        first.instruction_sections.clear()
+        first.role_section = None
+        builder.analyze_base_prompt("p", "m", prompt)["tone"].append("grumpy")
+
+        second = builder.parse_prompt(prompt)
+
+        assert second.tone_indicators == ["friendly"]
+        assert second.instruction_sections
+        assert second.role_section is not None
+
     def test_parse_prompt_sectioned(self):
         """Test parsing a sectioned prompt."""
         builder = PromptBuilder()
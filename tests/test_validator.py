@@ -0,0 +1,149 @@
+"""
+Tests for the EducationalValidator class.
+"""
+
+import json
+
+import pytest
+from agiterminal.validator import EducationalValidator
+
+
+class TestEducationalValidator:
+    """Test cases for EducationalValidator."""
+
+    @pytest.mark.parametrize("content, is_valid", [
+        ("A lesson about Star Wars.", True),
+        ("Maori culture and stalinist architecture.", True),
+        ("A biography of Stalin.", False),
+        ("mao\nzedong", False),
+    ])
+    def test_prohibited_terms_match_whole_words(self, content, is_valid):
+        """Test that prohibited terms only count as whole words."""
+        result = EducationalValidator().validate_prompt(content)
+
+        assert result.is_valid is is_valid
+
+    def test_subclass_and_instance_rule_overrides(self, tmp_path):
+        """Test that overridden prohibited terms and metadata fields are checked."""
+        class StrictValidator(EducationalValidator):
+            PROHIBITED_TERMS = EducationalValidator.PROHIBITED_TERMS | {"darth"}
+            REQUIRED_METADATA_FIELDS = ["author"]
+
+        assert StrictValidator().validate_prompt("Darth Vader").is_valid is False
+        assert EducationalValidator().validate_prompt("Darth Vader").is_valid is True
+
+        validator = EducationalValidator()
+        validator.PROHIBITED_TERMS = {"sith"}
+
+        assert validator.validate_prompt("A Sith lord").is_valid is False
+
+        path = tmp_path / "p.md"
+        path.write_text("**Source:** x\n**Model:** y\n\n## System Prompt\n")
+
+        warnings = StrictValidator().validate_system_prompt_file(str(path)).warnings
+
+        assert "Missing metadata field: 'author'" in warnings
+        assert "Missing metadata field: 'source'" not in warnings
+
+    def test_batch_validate_directory(self, tmp_path):
+        """Test validating every markdown file under a directory."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "ok.md").write_text("**Source:** x\n**Model:** y\n\n## System Prompt\n")
+        (tmp_path / "sub" / "bad.md").write_text("genocide")
+        (tmp_path / "notes.txt").write_text("genocide")
+
+        results = EducationalValidator().batch_validate_directory(str(tmp_path))
+
+        assert {path: r.is_valid for path, r in results.items()} == {
+            str(tmp_path / "ok.md"): True,
+            str(tmp_path / "sub" / "bad.md"): False,
+        }
+        assert results[str(tmp_path / "ok.md")].warnings == []
+
+    def test_batch_validate_reuses_cached_results(self, tmp_path, monkeypatch):
+        """Test that unchanged files are served from the cache file on later runs."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("Stalin")
+        (docs / "b.md").write_text("Fine")
+        cache = str(tmp_path / "cache.json")
+        validated = []
+        original = EducationalValidator.validate_system_prompt_file
+        monkeypatch.setattr(
+            EducationalValidator, "validate_system_prompt_file",
+            lambda self, path: validated.append(path) or original(self, path)
+        )
+
+        first = EducationalValidator().batch_validate_directory(str(docs), cache_path=cache)
+        second = EducationalValidator().batch_validate_directory(str(docs), cache_path=cache)
+
+        assert len(validated) == 2
+        assert second == first
+
+        (docs / "b.md").write_text("Genocide, rewritten")
+        third = EducationalValidator().batch_validate_directory(str(docs), cache_path=cache)
+
+        assert validated[2:] == [str(docs / "b.md")]
+        assert third[str(docs / "b.md")].is_valid is False
+
+    def test_batch_validate_ignores_foreign_cache(self, tmp_path):
+        """Test that corrupt caches and caches from other rule versions are not used."""
+        (tmp_path / "a.md").write_text("Stalin")
+        cache = tmp_path / "cache.json"
+        cache.write_text("{not json")
+
+        results = EducationalValidator().batch_validate_directory(str(tmp_path), cache_path=str(cache))
+
+        assert results[str(tmp_path / "a.md")].is_valid is False
+
+        class NewRules(EducationalValidator):
+            RULES_VERSION = EducationalValidator.RULES_VERSION + 1
+            PROHIBITED_TERMS = set()
+
+        results = NewRules().batch_validate_directory(str(tmp_path), cache_path=str(cache))
+
+        assert results[str(tmp_path / "a.md")].is_valid is True
+
+    def test_batch_validate_cache_misses_on_rule_overrides(self, tmp_path):
+        """Test that a cache warmed under other rule tables is not reused."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("A lesson about zorblax.")
+        cache = tmp_path / "cache.json"
+
+        results = EducationalValidator().batch_validate_directory(str(docs), cache_path=str(cache))
+        assert results[str(docs / "a.md")].is_valid is True
+
+        validator = EducationalValidator()
+        validator.PROHIBITED_TERMS = {"zorblax"}
+        results = validator.batch_validate_directory(str(docs), cache_path=str(cache))
+
+        assert results[str(docs / "a.md")].is_valid is False
+
+    def test_batch_validate_ignores_malformed_cache_entries(self, tmp_path):
+        """Test that non-dict cache entries are revalidated instead of crashing."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("Stalin")
+        (docs / "b.md").write_text("Star Wars")
+        validator = EducationalValidator()
+        cache = tmp_path / "cache.json"
+        cache.write_text(json.dumps({
+            "validator": validator._cache_owner(),
+            "files": {str(docs / "a.md"): ["not", "a", "dict"], str(docs / "b.md"): 3},
+        }))
+
+        results = validator.batch_validate_directory(str(docs), cache_path=str(cache))
+
+        assert results[str(docs / "a.md")].is_valid is False
+        assert results[str(docs / "b.md")].is_valid is True
+
+    def test_batch_validate_survives_unwritable_cache(self, tmp_path):
+        """Test that a cache path that cannot be written does not fail the run."""
+        (tmp_path / "a.md").write_text("Stalin")
+        cache = tmp_path / "missing-dir" / "cache.json"
+
+        results = EducationalValidator().batch_validate_directory(str(tmp_path), cache_path=str(cache))
+
+        assert results[str(tmp_path / "a.md")].is_valid is False
+        assert not cache.exists()